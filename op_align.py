@@ -1,122 +1,108 @@
-import bpy
-import bmesh
-import operator
-from mathutils import Vector
-from collections import defaultdict
-from math import pi
-
-from . import utilities_uv
-
-
-class op(bpy.types.Operator):
-    bl_idname = "uv.textools_align"
-    bl_label = "Align"
-    bl_description = "Align vertices, edges or shells"
-    bl_options = {'REGISTER', 'UNDO'}
-
-    direction: bpy.props.StringProperty(name="Direction", default="top")
-
-    @classmethod
-    def poll(cls, context):
-        if not bpy.context.active_object:
-            return False
-
-        # Only in Edit mode
-        if bpy.context.active_object.mode != 'EDIT':
-            return False
-
-        # Only in UV editor mode
-        if bpy.context.area.type != 'IMAGE_EDITOR':
-            return False
-
-        # Requires UV map
-        if not bpy.context.object.data.uv_layers:
-            # self.report({'WARNING'}, "Object must have more than one UV map")
-            return False
-
-        # Not in Synced mode
-        if bpy.context.scene.tool_settings.use_uv_select_sync:
-            return False
-
-        return True
-
-    def execute(self, context):
-
-        align(context, self.direction)
-        return {'FINISHED'}
-
-
-def align(context, direction):
-    # Store selection
-    utilities_uv.selection_store()
-
-    if bpy.context.tool_settings.transform_pivot_point != 'CURSOR':
-        bpy.context.tool_settings.transform_pivot_point = 'CURSOR'
-
-    # B-Mesh
-    obj = bpy.context.active_object
-    bm = bmesh.from_edit_mesh(obj.data)
-    uv_layers = bm.loops.layers.uv.verify()
-
-    if len(obj.data.uv_layers) == 0:
-        print("There is no UV channel or UV data set")
-        return
-
-    # Collect BBox sizes
-    boundsAll = utilities_uv.getSelectionBBox()
-
-    mode = bpy.context.scene.tool_settings.uv_select_mode
-    if mode == 'FACE' or mode == 'ISLAND':
-        print("____ Align Islands")
-
-        # Collect UV islands
-        islands = utilities_uv.getSelectionIslands()
-
-        for island in islands:
-
-            bpy.ops.uv.select_all(action='DESELECT')
-            utilities_uv.set_selected_faces(island)
-            bounds = utilities_uv.getSelectionBBox()
-
-            # print("Island "+str(len(island))+"x faces, delta: "+str(delta.y))
-
-            if direction == "bottom":
-                delta = boundsAll['min'] - bounds['min']
-                bpy.ops.transform.translate(value=(0, delta.y, 0))
-            elif direction == "top":
-                delta = boundsAll['max'] - bounds['max']
-                bpy.ops.transform.translate(value=(0, delta.y, 0))
-            elif direction == "left":
-                delta = boundsAll['min'] - bounds['min']
-                bpy.ops.transform.translate(value=(delta.x, 0, 0))
-            elif direction == "right":
-                delta = boundsAll['max'] - bounds['max']
-                bpy.ops.transform.translate(value=(delta.x, 0, 0))
-            else:
-                print("Unkown direction: "+str(direction))
-
-    elif mode == 'EDGE' or mode == 'VERTEX':
-        print("____ Align Verts")
-
-        for f in bm.faces:
-            if f.select:
-                for l in f.loops:
-                    luv = l[uv_layers]
-                    if luv.select:
-                        # print("Idx: "+str(luv.uv))
-                        if direction == "top":
-                            luv.uv[1] = boundsAll['max'].y
-                        elif direction == "bottom":
-                            luv.uv[1] = boundsAll['min'].y
-                        elif direction == "left":
-                            luv.uv[0] = boundsAll['min'].x
-                        elif direction == "right":
-                            luv.uv[0] = boundsAll['max'].x
-
-        bmesh.update_edit_mesh(obj.data)
-
-    # Restore selection
-    utilities_uv.selection_restore()
-
-
-bpy.utils.register_class(op)
+import bpy
+import bmesh
+import operator
+import numpy as np
+from mathutils import Vector
+from collections import defaultdict
+from math import pi
+
+from . import utilities_uv
+from . import utilities_uv_transform
+
+
+class op(bpy.types.Operator):
+    bl_idname = "uv.textools_align"
+    bl_label = "Align"
+    bl_description = "Align vertices, edges or shells"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    direction: bpy.props.StringProperty(name="Direction", default="top")
+
+    @classmethod
+    def poll(cls, context):
+        if not bpy.context.active_object:
+            return False
+
+        # Only in Edit mode
+        if bpy.context.active_object.mode != 'EDIT':
+            return False
+
+        # Only in UV editor mode
+        if bpy.context.area.type != 'IMAGE_EDITOR':
+            return False
+
+        # Requires UV map
+        if not bpy.context.object.data.uv_layers:
+            # self.report({'WARNING'}, "Object must have more than one UV map")
+            return False
+
+        # Not in Synced mode
+        if bpy.context.scene.tool_settings.use_uv_select_sync:
+            return False
+
+        return True
+
+    def execute(self, context):
+
+        align(context, self.direction)
+        return {'FINISHED'}
+
+
+def align(context, direction):
+    # Store selection
+    utilities_uv.selection_store()
+
+    # All objects in edit mode are aligned together
+    buffer = utilities_uv.get_buffer()
+    if buffer == None:
+        print("There is no UV channel or UV data set")
+        utilities_uv.selection_restore()
+        return
+
+    # Collect BBox sizes
+    boundsAll = utilities_uv.getSelectionBBox(buffer)
+
+    mode = bpy.context.scene.tool_settings.uv_select_mode
+    if mode == 'FACE' or mode == 'ISLAND':
+        print("____ Align Islands")
+
+        # Collect UV islands
+        islands, island_objects = utilities_uv.getSelectionIslandsObjects(buffer.objects)
+        mins, maxs, centers = utilities_uv.get_island_bounds_arrays(islands, buffer, island_objects)
+
+        # Offset per island, all islands are moved in one go
+        offsets = np.zeros((len(islands), 2))
+        if direction == "bottom":
+            offsets[:, 1] = boundsAll['min'].y - mins[:, 1]
+        elif direction == "top":
+            offsets[:, 1] = boundsAll['max'].y - maxs[:, 1]
+        elif direction == "left":
+            offsets[:, 0] = boundsAll['min'].x - mins[:, 0]
+        elif direction == "right":
+            offsets[:, 0] = boundsAll['max'].x - maxs[:, 0]
+        else:
+            print("Unkown direction: "+str(direction))
+
+        loops, _, counts = utilities_uv.get_islands_loops(islands, buffer, island_objects)
+        utilities_uv_transform.apply_batch(buffer, loops, counts, [utilities_uv_transform.matrix_translate(offset) for offset in offsets])
+        buffer.write_uvs()
+
+    elif mode == 'EDGE' or mode == 'VERTEX':
+        print("____ Align Verts")
+
+        loops = buffer.get_selected_loops()
+        if direction == "top":
+            buffer.uvs[loops, 1] = boundsAll['max'].y
+        elif direction == "bottom":
+            buffer.uvs[loops, 1] = boundsAll['min'].y
+        elif direction == "left":
+            buffer.uvs[loops, 0] = boundsAll['min'].x
+        elif direction == "right":
+            buffer.uvs[loops, 0] = boundsAll['max'].x
+        buffer.write_uvs()
+
+    # Restore selection
+    utilities_uv.selection_restore()
+
+
+bpy.utils.register_class(op)
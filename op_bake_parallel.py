@@ -0,0 +1,295 @@
+import bpy
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import subprocess
+
+from . import settings
+from . import utilities_ui
+from . import utilities_bake as ub
+from . import op_bake
+
+
+class op(bpy.types.Operator):
+    bl_idname = "uv.textools_bake_parallel"
+    bl_label = "Bake Parallel"
+    bl_description = "Bake the sets in background Blender instances, the images are loaded as each set finishes"
+
+    @classmethod
+    def poll(cls, context):
+        if len(settings.sets) == 0:
+            return False
+
+        # Sets of a single texture bake into each other
+        if bpy.context.scene.texToolsSettings.bake_force_single:
+            return False
+
+        return True
+
+    def execute(self, context):
+        bake_mode = utilities_ui.get_bake_mode()
+
+        if bake_mode not in op_bake.modes:
+            self.report({'ERROR_INVALID_INPUT'}, "Uknown mode '{}' only available: '{}'".format(
+                bake_mode, ", ".join(op_bake.modes.keys())))
+            return {'CANCELLED'}
+
+        if not start_workers(self, context, bake_mode):
+            return {'CANCELLED'}
+
+        context.window_manager.modal_handler_add(self)
+        self.timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            stop_workers(self)
+            finish(self, context)
+            self.report({'WARNING'}, "Parallel bake cancelled, {}x of {}x sets loaded".format(len(self.loaded), len(self.sets)))
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+            if update_workers(self, context):
+                finish(self, context)
+                return {'FINISHED'}
+
+        return {'PASS_THROUGH'}
+
+
+
+def start_workers(self, context, mode):
+    props = bpy.context.scene.texToolsSettings
+    sets = settings.sets
+
+    # Check the sets up front, a worker would only find out after loading the file
+    for set in sets:
+        if set.has_issues:
+            self.report({'ERROR_INVALID_INPUT'}, "The set '{}' has issues, check the low poly, cage and UV maps".format(set.name))
+            return False
+
+    threads = props.bake_parallel_threads
+    count = props.bake_parallel_workers
+    if count == 0:
+        count = max(1, (os.cpu_count() or 1) // threads)
+    count = min(count, len(sets))
+
+    self.mode = mode
+    self.sets = [set.name for set in sets]
+    self.loaded = []
+    self.failed = []
+    self.time_start = time.time()
+    self.folder = tempfile.mkdtemp(prefix="textools_bake_")
+    self.folder_output = os.path.join(self.folder, "output")
+    os.makedirs(os.path.join(self.folder_output, "partial"))
+
+    # Workers bake a copy of the file, with objects outside of the sets hidden like in a regular bake
+    path_blend = os.path.join(self.folder, "bake.blend")
+    ub.store_bake_settings()
+    bpy.ops.wm.save_as_mainfile(filepath=path_blend, copy=True, check_existing=False)
+    ub.restore_bake_settings()
+
+    # Worker command, the add-on is enabled explicitly in case it is not part of the user preferences
+    expression = "import {0}.op_bake_parallel; {0}.op_bake_parallel.run_worker()".format(__package__)
+
+    self.processes = []
+    for i, indices in enumerate(get_worker_sets(sets, count)):
+        job = {
+            'mode': mode,
+            'size': list(props.size),
+            'sampling_scale': int(props.bake_sampling),
+            'samples': props.bake_samples,
+            'ray_distance': props.bake_ray_distance,
+            'threads': threads,
+            'output': self.folder_output,
+            'sets': [get_set_job(sets[index], index) for index in indices]
+        }
+        path_job = os.path.join(self.folder, "job_{}.json".format(i))
+        with open(path_job, 'w') as file:
+            json.dump(job, file)
+
+        path_log = os.path.join(self.folder, "worker_{}.log".format(i))
+        with open(path_log, 'w') as log:
+            process = subprocess.Popen(
+                [bpy.app.binary_path, "-b", path_blend, "--addons", __package__, "-t", str(threads),
+                    "--python-exit-code", "1", "--python-expr", expression, "--", path_job],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                preexec_fn=get_memory_limit(props.bake_parallel_memory)
+            )
+        self.processes.append((process, path_log))
+
+    print("Bake parallel '{}' {}x sets on {}x workers with {}x threads".format(mode, len(sets), count, threads))
+    return True
+
+
+
+def get_worker_sets(sets, count):
+    """Set indices per worker, the largest sets are handed out first to the least loaded worker"""
+    costs = []
+    for set in sets:
+        costs.append(sum(len(obj.data.polygons) for obj in set.objects_low + set.objects_high + set.objects_float))
+
+    workers = [[] for i in range(count)]
+    loads = [0] * count
+    for index in sorted(range(len(sets)), key=lambda index: -costs[index]):
+        worker = loads.index(min(loads))
+        workers[worker].append(index)
+        loads[worker] += costs[index]
+
+    return [sorted(indices) for indices in workers if len(indices) > 0]
+
+
+
+def get_set_job(set, index):
+    # Sets are passed by object names, the worker finds them again in the copy of the file
+    return {
+        'index': index,
+        'name': set.name,
+        'low': [obj.name for obj in set.objects_low],
+        'cage': [obj.name for obj in set.objects_cage],
+        'high': [obj.name for obj in set.objects_high],
+        'float': [obj.name for obj in set.objects_float]
+    }
+
+
+
+def get_memory_limit(megabytes):
+    # Address space limit of a worker, only available on Unix systems
+    if megabytes <= 0 or os.name != 'posix':
+        return None
+
+    def limit():
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (megabytes * 1024 * 1024, megabytes * 1024 * 1024))
+
+    return limit
+
+
+
+def update_workers(self, context):
+    """Load finished images and collect exited workers, returns True when all work is done"""
+    running = []
+    for process, path_log in self.processes:
+        if process.poll() is None:
+            running.append((process, path_log))
+        elif process.returncode != 0:
+            self.failed.append(path_log)
+            print("Bake worker failed with code {}, see {}".format(process.returncode, path_log))
+    self.processes = running
+
+    # Workers move finished images out of the partial folder, so every listed file is complete
+    for file_name in sorted(os.listdir(self.folder_output)):
+        path = os.path.join(self.folder_output, file_name)
+        if not os.path.isfile(path):
+            continue
+
+        index = int(os.path.splitext(file_name)[0])
+        image = op_bake.setup_image_from_file(self.mode, "{}_{}".format(self.sets[index], self.mode), path)
+        os.remove(path)
+        self.loaded.append(index)
+        print("Loaded '{}' {}/{}".format(image.name, len(self.loaded), len(self.sets)))
+
+        if context.screen:
+            for area in context.screen.areas:
+                if area.type == 'IMAGE_EDITOR':
+                    area.spaces[0].image = image
+                    area.tag_redraw()
+
+    return len(self.processes) == 0
+
+
+
+def stop_workers(self):
+    for process, path_log in self.processes:
+        process.terminate()
+    for process, path_log in self.processes:
+        process.wait()
+    self.processes = []
+
+
+
+def finish(self, context):
+    context.window_manager.event_timer_remove(self.timer)
+
+    elapsed = time.time() - self.time_start
+    if len(self.failed) > 0:
+        # Keep the logs of failed workers
+        self.report({'ERROR'}, "{}x workers failed, {}x of {}x sets baked. Logs: {}".format(
+            len(self.failed), len(self.loaded), len(self.sets), ", ".join(self.failed)))
+    else:
+        shutil.rmtree(self.folder, ignore_errors=True)
+        self.report({'INFO'}, "Baked {}x sets in parallel in {:.1f}s".format(len(self.loaded), elapsed))
+
+
+
+def run_worker():
+    """Entry point of a background worker: bakes the sets of the job file passed after '--' and saves each image as it finishes"""
+    path_job = sys.argv[sys.argv.index("--") + 1]
+    with open(path_job) as file:
+        job = json.load(file)
+
+    # CPU Cycles with the thread count of this worker
+    scene = bpy.context.scene
+    scene.render.threads_mode = 'FIXED'
+    scene.render.threads = job['threads']
+    scene.cycles.device = 'CPU'
+
+    mode = job['mode']
+    report = ub.BakeReport()
+    time_start = time.time()
+    for set_job in job['sets']:
+        time_set = time.time()
+        settings.sets = [get_set(set_job)]
+        op_bake.bake(
+            self=report,
+            mode=mode,
+            size=job['size'],
+            bake_single=False,
+            sampling_scale=job['sampling_scale'],
+            samples=job['samples'],
+            ray_distance=job['ray_distance']
+        )
+        if len(report.errors) > 0:
+            sys.exit(1)
+
+        path = save_result(bpy.data.images["{}_{}".format(set_job['name'], mode)], job['output'], set_job['index'])
+        print("Baked '{}' in {:.2f}s = {}".format(set_job['name'], time.time() - time_set, path))
+
+    print("Baked {}x sets in {:.2f}s".format(len(job['sets']), time.time() - time_start))
+
+
+
+def get_set(set_job):
+    objects = bpy.data.objects
+    return ub.BakeSet(
+        set_job['name'],
+        [objects[name] for name in set_job['low']],
+        [objects[name] for name in set_job['cage']],
+        [objects[name] for name in set_job['high']],
+        [objects[name] for name in set_job['float']]
+    )
+
+
+
+def save_result(image, folder, index):
+    # Saved next to the output first and moved in when complete, the UI session only sees finished files
+    if image.is_float:
+        image.file_format = 'OPEN_EXR'
+        extension = ".exr"
+    else:
+        image.file_format = 'TARGA'
+        extension = ".tga"
+
+    path_partial = os.path.join(folder, "partial", "{}{}".format(index, extension))
+    path = os.path.join(folder, "{}{}".format(index, extension))
+    image.filepath_raw = path_partial
+    image.save()
+    os.replace(path_partial, path)
+    return path
+
+
+
+bpy.utils.register_class(op)
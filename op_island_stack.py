@@ -0,0 +1,188 @@
+import bpy
+import bmesh
+import operator
+import numpy as np
+from collections import Counter
+
+from . import utilities_uv
+from . import utilities_uv_geometry
+from . import utilities_uv_transform
+
+
+# Walks tried per duplicate, in order of how well the seed face alone fits
+walks_max = 8
+
+# Fit error per loop relative to the island size, a walk that fits this well ends the search
+fit_tolerance = 0.0001
+
+
+class op(bpy.types.Operator):
+    bl_idname = "uv.textools_island_stack"
+    bl_label = "Stack Identical"
+    bl_description = "Stack selected UV islands with identical topology on top of the first island of each group"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_reflection : bpy.props.BoolProperty(name="Reflection", description="Allow mirrored islands to be flipped onto each other", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        if not bpy.context.active_object:
+            return False
+
+        if bpy.context.active_object.type != 'MESH':
+            return False
+
+        #Only in Edit mode
+        if bpy.context.active_object.mode != 'EDIT':
+            return False
+
+        #Only in UV editor mode
+        if bpy.context.area.type != 'IMAGE_EDITOR':
+            return False
+
+        ##Requires UV map
+        if not bpy.context.object.data.uv_layers:
+            return False
+
+        #Not in Synced mode
+        if bpy.context.scene.tool_settings.use_uv_select_sync:
+            return False
+
+        return True
+
+
+    def execute(self, context):
+        stack(self, context, self.use_reflection)
+        return {'FINISHED'}
+
+
+
+def stack(self, context, use_reflection):
+    objects = utilities_uv.get_objects()
+    meshes = []
+    for obj in objects:
+        bm = bmesh.from_edit_mesh(obj.data)
+        meshes.append( (bm, bm.loops.layers.uv.verify(), obj.data) )
+
+    islands, island_objects = utilities_uv.getSelectionIslandsObjects(objects)
+    if len(islands) < 2:
+        return
+
+    buffer = utilities_uv.get_buffer(objects)
+
+    # Fit in pixel space, so rotations match the UV editor
+    to_pixels = np.diag((utilities_uv_transform.get_aspect(), 1.0, 1.0))
+    from_pixels = np.linalg.inv(to_pixels)
+
+    # Group islands by topology
+    hashes = [utilities_uv.get_island_hash(island, *meshes[island_objects[i]]) for i, island in enumerate(islands)]
+    groups = utilities_uv.get_islands_identical(hashes)
+
+    stack_loops = []
+    stack_matrices = []
+    count_masters = 0
+    for group in groups:
+        if len(group) < 2:
+            continue
+
+        # The first island stays, start walking it at a face with a rare label to keep the candidates few
+        master = islands[group[0]]
+        labels = utilities_uv.get_island_labels(master, utilities_uv.get_island_adjacency(master)[0])
+        label_counts = Counter(labels.values())
+        seed = min(master, key=lambda face: label_counts[labels[face]])
+        master_indices = get_loop_indices(buffer, master, island_objects[group[0]])
+
+        # The seed face is fitted together with the island center, so the fit also tells where in the island a start is
+        master_uvs = get_pixels(buffer, list(master_indices.values()), to_pixels)
+        seed_uvs = np.vstack((get_pixels(buffer, [master_indices[loop] for loop in seed.loops], to_pixels), master_uvs.mean(axis=0)))
+        tolerance = (fit_tolerance * np.max(master_uvs.max(axis=0) - master_uvs.min(axis=0))) ** 2
+
+        # Walk each duplicate in step with the master from the starts where the seed face fits best
+        target = None
+        count_stacked = 0
+        for i in group[1:]:
+            island = islands[i]
+            labels_island = utilities_uv.get_island_labels(island, utilities_uv.get_island_adjacency(island)[0])
+            island_indices = get_loop_indices(buffer, island, island_objects[i])
+
+            starts = []
+            for face in island:
+                if labels_island[face] != labels[seed] or len(face.loops) != len(seed.loops):
+                    continue
+                for loop in face.loops:
+                    for reverse in ((False, True) if use_reflection else (False,)):
+                        starts.append((loop, reverse))
+            if len(starts) == 0:
+                continue
+
+            # Symmetric islands have many valid walks, only the starts that put the seed face in the same place and turn are walked
+            start_loops = [[island_indices[l] for l in get_face_loops(loop, reverse)] for loop, reverse in starts]
+            start_uvs = get_pixels(buffer, start_loops, to_pixels)
+            center = get_pixels(buffer, list(island_indices.values()), to_pixels).mean(axis=0)
+            start_uvs = np.concatenate((start_uvs, np.broadcast_to(center, (len(starts), 1, 2))), axis=1)
+            matrices, errors = utilities_uv_geometry.get_rigid_fit(start_uvs, seed_uvs, use_reflection)
+
+            best = None
+            for start in np.argsort(errors, kind='stable')[:walks_max].tolist():
+                loop, reverse = starts[start]
+                pairs = utilities_uv.get_island_correspondence(seed.loops[0], loop, master, island, reverse)
+                if not pairs:
+                    continue
+                if target is None:
+                    target = get_pixels(buffer, [master_indices[a] for a, b in pairs], to_pixels)
+
+                loops = np.array([island_indices[b] for a, b in pairs], dtype=np.int64)
+                matrices, errors = utilities_uv_geometry.get_rigid_fit(get_pixels(buffer, loops, to_pixels)[None], target, use_reflection)
+                if best is None or errors[0] < best[2]:
+                    best = (loops, matrices[0], errors[0])
+                if errors[0] <= tolerance * len(loops):
+                    break
+
+            if best:
+                stack_loops.append(best[0])
+                stack_matrices.append(from_pixels @ best[1] @ to_pixels)
+                count_stacked += 1
+
+        if count_stacked == 0:
+            continue
+
+        count_masters += 1
+
+    # Move all duplicates in one go
+    if len(stack_loops) > 0:
+        counts = [len(loops) for loops in stack_loops]
+        utilities_uv_transform.apply_batch(buffer, np.concatenate(stack_loops), counts, stack_matrices)
+        buffer.write_uvs()
+
+    self.report({'INFO'}, "{}x islands stacked onto {}x islands".format(len(stack_loops), count_masters))
+
+
+
+def get_pixels(buffer, loops, to_pixels):
+    # UVs of buffer loops in pixel space
+    return buffer.uvs[np.asarray(loops, dtype=np.int64)].astype(np.float64) @ to_pixels[0:2, 0:2]
+
+
+
+def get_face_loops(loop, reverse=False):
+    # Loops of the face starting at the loop, walked backwards in reverse like get_island_correspondence
+    loops = [loop]
+    for i in range(len(loop.face.loops) - 1):
+        loops.append(loops[-1].link_loop_prev if reverse else loops[-1].link_loop_next)
+    return loops
+
+
+
+def get_loop_indices(buffer, island, object_index):
+    # Buffer index of every BMesh loop of the island, loops follow the face loop start in face order
+    indices = {}
+    offset = buffer.face_offsets[object_index]
+    for face in island:
+        start = int(buffer.face_loop_start[face.index + offset])
+        for i, loop in enumerate(face.loops):
+            indices[loop] = start + i
+    return indices
+
+
+
+bpy.utils.register_class(op)
@@ -1,257 +1,243 @@
-import bpy
-import bmesh
-import operator
-import math
-from mathutils import Vector
-from collections import defaultdict
-from math import pi
-
-from . import utilities_uv
-
-
-class op(bpy.types.Operator):
-    bl_idname = "uv.textools_island_straighten_edge_loops"
-    bl_label = "Straight edge loops"
-    bl_description = "Straighten edge loops of UV Island and relax rest"
-    bl_options = {'REGISTER', 'UNDO'}
-
-    @classmethod
-    def poll(cls, context):
-
-        if not bpy.context.active_object:
-            return False
-
-        if bpy.context.active_object.type != 'MESH':
-            return False
-
-        # Only in Edit mode
-        if bpy.context.active_object.mode != 'EDIT':
-            return False
-
-        # Only in UV editor mode
-        if bpy.context.area.type != 'IMAGE_EDITOR':
-            return False
-
-        # Requires UV map
-        if not bpy.context.object.data.uv_layers:
-            return False
-
-        if bpy.context.scene.tool_settings.uv_select_mode != 'EDGE':
-            return False
-
-        return True
-
-    def execute(self, context):
-
-        main(context)
-        return {'FINISHED'}
-
-
-def main(context):
-    print("____________________________")
-
-    # Store selection
-    utilities_uv.selection_store()
-
-    bm = bmesh.from_edit_mesh(bpy.context.active_object.data)
-    uv_layers = bm.loops.layers.uv.verify()
-
-    edges = utilities_uv.get_selected_uv_edges(bm, uv_layers)
-    islands = utilities_uv.getSelectionIslands()
-    uvs = utilities_uv.get_selected_uvs(bm, uv_layers)
-    faces = [f for island in islands for f in island]
-
-    # Get island faces
-
-    # utilities_uv.selection_restore(bm, uv_layers)
-
-    groups = get_edge_groups(bm, uv_layers, faces, edges, uvs)
-
-    bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='FACE')
-    bpy.ops.mesh.select_all(action='DESELECT')
-    for face in faces:
-        face.select = True
-
-    print("Edges {}x".format(len(edges)))
-    print("Groups {}x".format(len(groups)))
-
-    # Restore 3D face selection
-
-    # Restore UV seams and clear pins
-    bpy.ops.uv.seams_from_islands()
-    bpy.ops.uv.pin(clear=True)
-
-    edge_sets = []
-    for edges in groups:
-        edge_sets.append(EdgeSet(bm, uv_layers, edges, faces))
-        # straighten_edges(bm, uv_layers, edges, faces)
-
-    sorted_sets = sorted(edge_sets, key=lambda x: x.length, reverse=True)
-
-    for edge_set in sorted_sets:
-        edge_set.straighten()
-
-    # Restore selection
-    utilities_uv.selection_restore()
-
-
-class EdgeSet:
-    bm = None
-    edges = []
-    faces = []
-    uv_layers = ''
-    vert_to_uv = {}
-    edge_length = {}
-    length = 0
-
-    def __init__(self, bm, uv_layers, edges, faces):
-        self.bm = bm
-        self.uv_layers = uv_layers
-        self.edges = edges
-        self.faces = faces
-
-        # Get Vert to UV within faces
-        self.vert_to_uv = utilities_uv.get_vert_to_uv(bm, uv_layers)
-
-        # Get edge lengths
-        self.edge_length = {}
-        self.length = 0
-        for e in edges:
-            uv1 = self.vert_to_uv[e.verts[0]][0].uv
-            uv2 = self.vert_to_uv[e.verts[1]][0].uv
-            self.edge_length[e] = (uv2 - uv1).length
-            self.length += self.edge_length[e]
-
-    def straighten(self):
-        print("Straight {}x at {:.2f} length ".format(
-            len(self.edges), self.length))
-
-        # Get edge angles in UV space
-        angles = {}
-        for edge in self.edges:
-            uv1 = self.vert_to_uv[edge.verts[0]][0].uv
-            uv2 = self.vert_to_uv[edge.verts[1]][0].uv
-            delta = uv2 - uv1
-            angle = math.atan2(delta.y, delta.x) % (math.pi/2)
-            if angle >= (math.pi/4):
-                angle = angle - (math.pi/2)
-            angles[edge] = abs(angle)
-            # print("Angle {:.2f} degr".format(angle * 180 / math.pi))
-
-        # Pick edge with least rotation offset to U or V axis
-        edge_main = sorted(angles.items(), key=operator.itemgetter(1))[0][0]
-
-        print("Main edge: {} at {:.2f} degr".format(
-            edge_main.index, angles[edge_main] * 180 / math.pi))
-
-        # Rotate main edge to closest axis
-        uvs = [uv for v in edge_main.verts for uv in self.vert_to_uv[v]]
-        bpy.ops.uv.select_all(action='DESELECT')
-        for uv in uvs:
-            uv.select = True
-        uv1 = self.vert_to_uv[edge_main.verts[0]][0].uv
-        uv2 = self.vert_to_uv[edge_main.verts[1]][0].uv
-        diff = uv2 - uv1
-        angle = math.atan2(diff.y, diff.x) % (math.pi/2)
-        if angle >= (math.pi/4):
-            angle = angle - (math.pi/2)
-        bpy.ops.uv.cursor_set(location=uv1 + diff/2)
-        bpy.ops.transform.rotate(value=angle, orient_axis='Z', constraint_axis=(
-            False, False, False), orient_type='GLOBAL', mirror=False, use_proportional_edit=False)
-
-        # Expand edges and straighten
-        count = len(self.edges)
-        processed = [edge_main]
-        for i in range(count):
-            if(len(processed) < len(self.edges)):
-                verts = set([v for e in processed for v in e.verts])
-                edges_expand = [e for e in self.edges if e not in processed and (
-                    e.verts[0] in verts or e.verts[1] in verts)]
-                verts_ends = [
-                    v for e in edges_expand for v in e.verts if v in verts]
-
-                print("Step, proc {} exp: {}".format(
-                    [e.index for e in processed], [e.index for e in edges_expand]))
-
-                if len(edges_expand) == 0:
-                    continue
-
-                for edge in edges_expand:
-                    # if edge.verts[0] in verts_ends and edge.verts[1] in verts_ends:
-                    #     print("Cancel at edge {}".format(edge.index))
-                    #     return
-
-                    print("  E {} verts {} verts end: {}".format(edge.index, [
-                          v.index for v in edge.verts], [v.index for v in verts_ends]))
-                    v1 = [v for v in edge.verts if v in verts_ends][0]
-                    v2 = [v for v in edge.verts if v not in verts_ends][0]
-                    # direction
-                    previous_edge = [e for e in processed if e.verts[0]
-                                     in edge.verts or e.verts[1] in edge.verts][0]
-                    prev_v1 = [v for v in previous_edge.verts if v != v1][0]
-                    prev_v2 = [v for v in previous_edge.verts if v == v1][0]
-                    direction = (
-                        self.vert_to_uv[prev_v2][0].uv - self.vert_to_uv[prev_v1][0].uv).normalized()
-
-                    for uv in self.vert_to_uv[v2]:
-                        uv.uv = self.vert_to_uv[v1][0].uv + \
-                            direction * self.edge_length[edge]
-
-                print("Procesed {}x Expand {}x".format(
-                    len(processed), len(edges_expand)))
-                print("verts_ends: {}x".format(len(verts_ends)))
-                processed.extend(edges_expand)
-
-        # Select edges
-        uvs = list(
-            set([uv for e in self.edges for v in e.verts for uv in self.vert_to_uv[v]]))
-        bpy.ops.uv.select_all(action='DESELECT')
-        for uv in uvs:
-            uv.select = True
-
-        # Pin UV's
-        bpy.ops.uv.pin()
-        bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
-        bpy.ops.uv.pin(clear=True)
-
-
-def get_edge_groups(bm, uv_layers, faces, edges, uvs):
-    print("Get edge groups, edges {}x".format(len(edges))+"x")
-
-    bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='EDGE')
-
-    unmatched = edges.copy()
-
-    groups = []
-
-    for edge in edges:
-        if edge in unmatched:
-
-            # Loop select edge
-            bpy.ops.mesh.select_all(action='DESELECT')
-            edge.select = True
-            bpy.ops.mesh.loop_multi_select(ring=False)
-
-            # Isolate group within edges
-            group = [e for e in bm.edges if e.select and e in edges]
-            groups.append(group)
-
-            # Remove from unmatched
-            for e in group:
-                if e in unmatched:
-                    unmatched.remove(e)
-
-            print("  Edge {} : Group: {}x , unmatched: {}".format(
-                edge.index, len(group), len(unmatched)))
-
-            # return
-            # group = [edge]
-            # for e in bm.edges:
-            #     if e.select and e in unmatched:
-            #         unmatched.remove(e)
-            #         group.append(edge)
-
-    return groups
-
-
-bpy.utils.register_class(op)
+import bpy
+import bmesh
+import operator
+import math
+from mathutils import Vector
+from collections import defaultdict
+from math import pi
+import numpy as np
+
+from . import utilities_uv
+from . import utilities_uv_transform
+
+
+class op(bpy.types.Operator):
+    bl_idname = "uv.textools_island_straighten_edge_loops"
+    bl_label = "Straight edge loops"
+    bl_description = "Straighten edge loops of UV Island and relax rest"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+
+        if not bpy.context.active_object:
+            return False
+
+        if bpy.context.active_object.type != 'MESH':
+            return False
+
+        # Only in Edit mode
+        if bpy.context.active_object.mode != 'EDIT':
+            return False
+
+        # Only in UV editor mode
+        if bpy.context.area.type != 'IMAGE_EDITOR':
+            return False
+
+        # Requires UV map
+        if not bpy.context.object.data.uv_layers:
+            return False
+
+        if bpy.context.scene.tool_settings.uv_select_mode != 'EDGE':
+            return False
+
+        return True
+
+    def execute(self, context):
+
+        main(context)
+        return {'FINISHED'}
+
+
+def main(context):
+    print("____________________________")
+
+    # Store selection
+    utilities_uv.selection_store()
+
+    bm = bmesh.from_edit_mesh(bpy.context.active_object.data)
+    uv_layers = bm.loops.layers.uv.verify()
+
+    edges = utilities_uv.get_selected_uv_edges(bm, uv_layers)
+    islands = utilities_uv.getSelectionIslands()
+    faces = [f for island in islands for f in island]
+
+    # Get island faces
+
+    # utilities_uv.selection_restore(bm, uv_layers)
+
+    groups = get_edge_groups(edges)
+
+    bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='FACE')
+    bpy.ops.mesh.select_all(action='DESELECT')
+    for face in faces:
+        face.select = True
+
+    print("Edges {}x".format(len(edges)))
+    print("Groups {}x".format(len(groups)))
+
+    # Restore 3D face selection
+
+    # Restore UV seams and clear pins
+    bpy.ops.uv.seams_from_islands()
+    bpy.ops.uv.pin(clear=True)
+
+    # Vert to UV of the mesh, shared by all edge sets
+    vert_to_uv = utilities_uv.get_vert_to_uv(bm, uv_layers)
+
+    edge_sets = []
+    for edges in groups:
+        for verts, chain in get_edge_chains(edges):
+            edge_sets.append(EdgeSet(bm, uv_layers, verts, chain, vert_to_uv))
+
+    sorted_sets = sorted(edge_sets, key=lambda x: x.length, reverse=True)
+
+    for edge_set in sorted_sets:
+        edge_set.straighten()
+
+    # Restore selection
+    utilities_uv.selection_restore()
+
+
+class EdgeSet:
+    bm = None
+    verts = []
+    edges = []
+    uv_layers = ''
+    vert_to_uv = {}
+    is_closed = False
+    length = 0
+
+    def __init__(self, bm, uv_layers, verts, edges, vert_to_uv):
+        self.bm = bm
+        self.uv_layers = uv_layers
+        self.vert_to_uv = vert_to_uv
+
+        # Chain of verts in walking order, a closed loop ends at its first vert
+        self.is_closed = len(verts) > 2 and verts[0] == verts[-1]
+        self.verts = verts[:-1] if self.is_closed else verts
+        self.edges = edges
+
+        self.length = float(self.get_lengths(self.get_uvs()).sum())
+
+    def get_uvs(self):
+        return np.array([self.vert_to_uv[v][0].uv for v in self.verts], dtype=np.float64)
+
+    def get_lengths(self, uvs):
+        if self.is_closed:
+            uvs = np.concatenate((uvs, uvs[0:1]))
+        return np.linalg.norm(uvs[1:] - uvs[:-1], axis=1)
+
+    def straighten(self):
+        print("Straight {}x at {:.2f} length ".format(
+            len(self.edges), self.length))
+
+        uvs = self.get_uvs()
+        if len(uvs) < 2:
+            return
+
+        # Get edge angles in UV space
+        delta = np.roll(uvs, -1, axis=0) - uvs
+        if not self.is_closed:
+            delta = delta[:-1]
+        angles = np.arctan2(delta[:, 1], delta[:, 0]) % (math.pi/2)
+        angles = np.where(angles >= math.pi/4, angles - math.pi/2, angles)
+
+        # Pick edge with least rotation offset to U or V axis
+        index_main = int(np.argmin(np.abs(angles)))
+
+        print("Main edge: {} at {:.2f} degr".format(
+            self.edges[index_main].index, abs(angles[index_main]) * 180 / math.pi))
+
+        # A closed loop opens up at the far side of the main edge
+        if self.is_closed:
+            count = len(self.verts)
+            start = (index_main + count//2 + 1) % count
+            self.verts = self.verts[start:] + self.verts[:start]
+            uvs = np.roll(uvs, -start, axis=0)
+            index_main = (index_main - start) % count
+            self.is_closed = False
+
+        # Rotate main edge to closest axis
+        center = (uvs[index_main] + uvs[index_main + 1]) / 2
+        matrix = utilities_uv_transform.matrix_rotate(-angles[index_main], center)
+        direction = matrix[0:2, 0:2] @ (uvs[index_main + 1] - uvs[index_main])
+        direction = np.round(direction / np.linalg.norm(direction)) if np.linalg.norm(direction) > 0 else np.array((1.0, 0.0))
+
+        # Place the verts along the axis by their distance along the chain
+        distance = np.concatenate(((0,), np.cumsum(self.get_lengths(uvs))))
+        distance -= (distance[index_main] + distance[index_main + 1]) / 2
+        positions = center + distance[:, None] * direction
+
+        for v, pos in zip(self.verts, positions):
+            for uv in self.vert_to_uv[v]:
+                uv.uv = Vector(pos)
+
+        # Select edges
+        uvs = list(
+            set([uv for v in self.verts for uv in self.vert_to_uv[v]]))
+        bpy.ops.uv.select_all(action='DESELECT')
+        for uv in uvs:
+            uv.select = True
+
+        # Pin UV's
+        bpy.ops.uv.pin()
+        bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
+        bpy.ops.uv.pin(clear=True)
+
+
+def get_edge_chains(edges):
+    # Split edges into chains of verts, each walked once from one end
+    vert_edges = defaultdict(list)
+    for edge in edges:
+        for v in edge.verts:
+            vert_edges[v].append(edge)
+
+    processed = set()
+    chains = []
+    starts = [v for v in vert_edges if len(vert_edges[v]) == 1] + list(vert_edges)
+    for start in starts:
+        verts = [start]
+        chain = []
+        v = start
+        while True:
+            edge = next((e for e in vert_edges[v] if e not in processed), None)
+            if edge is None:
+                break
+            processed.add(edge)
+            chain.append(edge)
+            v = edge.other_vert(v)
+            verts.append(v)
+        if len(chain) > 0:
+            chains.append( (verts, chain) )
+
+    return chains
+
+
+def get_edge_groups(edges):
+    # Edges of the same edge loop like loop select finds them, walked over the vert adjacency instead of the selection
+    print("Get edge groups, edges {}x".format(len(edges)))
+
+    unmatched = set(edges)
+    groups = []
+    for edge in edges:
+        if edge not in unmatched:
+            continue
+        unmatched.remove(edge)
+
+        group = []
+        stack = [edge]
+        while stack:
+            e = stack.pop()
+            group.append(e)
+            for v in e.verts:
+                other = utilities_uv.get_edge_loop_next(e, v)
+                if other in unmatched:
+                    unmatched.remove(other)
+                    stack.append(other)
+        groups.append(group)
+
+    return groups
+
+
+bpy.utils.register_class(op)
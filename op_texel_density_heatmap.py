@@ -0,0 +1,157 @@
+import bpy
+import bmesh
+import operator
+import numpy as np
+
+from . import settings
+from . import utilities_texel
+from . import utilities_uv
+from . import utilities_uv_buffer
+from . import utilities_island_cache
+
+color_layer_name = "TT_texel_density"
+
+# Diverging ramp over the density ratio in log2 steps: too low, on target, too high
+ramp_steps = (-2.0, 0.0, 2.0)
+ramp_colors = (
+    (0.1, 0.3, 1.0, 1.0),
+    (0.9, 0.9, 0.9, 1.0),
+    (1.0, 0.15, 0.1, 1.0)
+)
+color_empty = (0.2, 0.2, 0.2, 1.0)
+
+# Histogram bins of the island ratios
+histogram_edges = (0.5, 0.8, 1.25, 2.0)
+histogram_labels = ("< 50%", "50-80%", "80-125%", "125-200%", "> 200%")
+
+
+class op(bpy.types.Operator):
+    bl_idname = "uv.textools_texel_density_heatmap"
+    bl_label = "Texel Heatmap"
+    bl_description = "Color the faces of the selected objects by their texel density relative to the Texel Density setting"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    use_histogram : bpy.props.BoolProperty(name="Histogram", description="Count the islands per density range and show them in the panel", default=True)
+
+    @classmethod
+    def poll(cls, context):
+        # Only in Object mode, colors are written to the mesh data
+        if bpy.context.mode != 'OBJECT':
+            return False
+
+        if len(bpy.context.selected_objects) == 0:
+            return False
+
+        return True
+
+    def execute(self, context):
+        heatmap(self, context, bpy.context.scene.texToolsSettings.texel_density)
+        return {'FINISHED'}
+
+
+
+def heatmap(self, context, density):
+    object_faces = utilities_texel.get_selected_object_faces()
+
+    # Warning: No valid input objects
+    if len(object_faces) == 0:
+        self.report({'ERROR_INVALID_INPUT'}, "No UV maps or meshes selected")
+        return
+    if density <= 0:
+        self.report({'ERROR_INVALID_INPUT'}, "Texel Density needs to be larger than 0")
+        return
+
+    fallback_size = tuple(bpy.context.scene.texToolsSettings.size)
+    for area in bpy.context.screen.areas if bpy.context.screen else []:
+        if area.type == 'IMAGE_EDITOR':
+            image = area.spaces[0].image
+            if image and image.size[0] > 0 and image.size[1] > 0:
+                fallback_size = tuple(image.size)
+            break
+
+    island_ratios = []
+    count_faces = 0
+    for obj in object_faces:
+        image = utilities_texel.get_object_texture_image(obj)
+        if image and image.size[0] > 0 and image.size[1] > 0:
+            size = tuple(image.size)
+        else:
+            size = fallback_size
+
+        buffer = utilities_uv_buffer.UVBuffer(obj)
+        mesh = obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co.shape = (len(mesh.vertices), 3)
+        count_faces += len(buffer.face_loop_start)
+
+        # Only faces whose UVs or verts changed since the last heatmap of the mesh are measured again
+        cache = utilities_island_cache.get_face_cache(mesh, buffer.uv_name, "texel_heatmap")
+        faces = cache.update(buffer, co, (size, tuple(tuple(row) for row in obj.matrix_world)))
+        values = cache.values
+        if 'area_vt' not in values:
+            values['area_vt'], values['area_uv'] = utilities_texel.get_face_areas(obj, buffer, size[0], size[1])
+            values['colors'] = np.empty((len(faces), 4), dtype=np.float32)
+        elif len(faces) > 0:
+            area_vt, area_uv = utilities_texel.get_face_areas(obj, buffer, size[0], size[1], faces=faces)
+            values['area_vt'][faces] = area_vt[faces]
+            values['area_uv'][faces] = area_uv[faces]
+        face_area_vt = values['area_vt']
+        face_area_uv = values['area_uv']
+
+        # Per face ratio to the target density on the color ramp, for all faces when the target changed
+        if values.get('density') != density:
+            values['density'] = density
+            faces = np.arange(len(buffer.face_loop_start))
+        face_colors = values['colors']
+        face_density = utilities_texel.get_density(face_area_vt[faces], face_area_uv[faces])
+        colors = np.empty((len(faces), 4), dtype=np.float32)
+        is_valid = face_density > 0
+        steps = np.log2(face_density[is_valid] / density)
+        for channel in range(4):
+            colors[is_valid, channel] = np.interp(steps, ramp_steps, [color[channel] for color in ramp_colors])
+        colors[~is_valid] = color_empty
+        face_colors[faces] = colors
+
+        is_layer_new = color_layer_name not in mesh.vertex_colors
+        if is_layer_new:
+            mesh.vertex_colors.new(name=color_layer_name)
+        layer = mesh.vertex_colors[color_layer_name]
+        mesh.vertex_colors.active = layer
+        if is_layer_new or len(faces) > 0:
+            layer.data.foreach_set("color", face_colors[buffer.loop_face].ravel())
+            mesh.update()
+
+        if self.use_histogram:
+            # Islands are found again only after UVs changed, otherwise only the islands of changed faces are summed again
+            if cache.face_island is None:
+                cache.face_island = utilities_uv.get_buffer_islands(buffer)
+                values.pop('island_vt', None)
+            face_island = cache.face_island
+            count = int(face_island.max()) + 1 if len(face_island) > 0 else 0
+            if 'island_vt' not in values:
+                values['island_vt'], values['island_uv'] = utilities_texel.get_group_areas(face_area_vt, face_area_uv, face_island, count)
+            elif len(faces) > 0:
+                islands = np.unique(face_island[faces])
+                is_changed = np.isin(face_island, islands)
+                island_vt, island_uv = utilities_texel.get_group_areas(face_area_vt[is_changed], face_area_uv[is_changed], face_island[is_changed], count)
+                values['island_vt'][islands] = island_vt[islands]
+                values['island_uv'][islands] = island_uv[islands]
+            island_density = utilities_texel.get_density(values['island_vt'], values['island_uv'])
+            island_ratios.extend((island_density[island_density > 0] / density).tolist())
+
+    if self.use_histogram:
+        counts = np.bincount(np.searchsorted(histogram_edges, island_ratios), minlength=len(histogram_labels))
+        settings.texel_heatmap = {
+            'density': density,
+            'histogram': list(zip(histogram_labels, counts.tolist())),
+            'islands': len(island_ratios)
+        }
+    else:
+        settings.texel_heatmap = None
+
+    self.report({'INFO'}, "Texel heatmap of {}x objects, {}x faces".format(len(object_faces), count_faces))
+
+
+
+bpy.utils.register_class(op)
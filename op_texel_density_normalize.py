@@ -0,0 +1,117 @@
+import bpy
+import bmesh
+import operator
+import time
+import numpy as np
+from collections import defaultdict
+
+from . import utilities_texel
+from . import utilities_uv
+from . import utilities_uv_buffer
+
+
+class op(bpy.types.Operator):
+    bl_idname = "uv.textools_texel_density_normalize"
+    bl_label = "Normalize Texel size"
+    bl_description = "Scale the UVs of all visible objects in the scene to the Texel Density, objects sharing a mesh are scaled once"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        # Only in Object mode, the meshes are read and written directly
+        if bpy.context.mode != 'OBJECT':
+            return False
+
+        return True
+
+    def execute(self, context):
+        normalize_texel_density(
+            self,
+            context,
+            bpy.context.scene.texToolsSettings.texel_mode_scale,
+            bpy.context.scene.texToolsSettings.texel_density
+        )
+        return {'FINISHED'}
+
+
+
+def normalize_texel_density(self, context, mode, density):
+    print("Normalize texel density")
+    time_start = time.time()
+
+    if density <= 0:
+        self.report({'ERROR_INVALID_INPUT'}, "Texel Density needs to be larger than 0")
+        return
+
+    # Objects sharing a mesh datablock are processed once
+    mesh_objects = defaultdict(list)
+    for obj in bpy.context.visible_objects:
+        if obj.type == 'MESH' and obj.data.uv_layers and not obj.data.library:
+            mesh_objects[obj.data].append(obj)
+
+    if len(mesh_objects) == 0:
+        self.report({'ERROR_INVALID_INPUT'}, "No visible meshes with UV maps")
+        return
+
+    fallback_size = tuple(bpy.context.scene.texToolsSettings.size)
+    for area in bpy.context.screen.areas if bpy.context.screen else []:
+        if area.type == 'IMAGE_EDITOR':
+            image = area.spaces[0].image
+            if image and image.size[0] > 0 and image.size[1] > 0:
+                fallback_size = tuple(image.size)
+            break
+
+    count_groups = 0
+    count_skipped = 0
+    for mesh, objects in mesh_objects.items():
+        obj = objects[0]
+        image = utilities_texel.get_object_texture_image(obj)
+        if image and image.size[0] > 0 and image.size[1] > 0:
+            size = tuple(image.size)
+        else:
+            size = fallback_size
+
+        # Areas in local space, scaled by the average area scale of the instances
+        buffer = utilities_uv_buffer.UVBuffer(obj)
+        face_area_vt, face_area_uv = utilities_texel.get_face_areas(obj, buffer, size[0], size[1], np.identity(4))
+        face_area_vt *= np.mean([abs(np.linalg.det(np.array(o.matrix_world)[0:3, 0:3])) ** (2/3) for o in objects])
+
+        # Groups of faces to scale together
+        if mode == 'ISLAND':
+            face_group = utilities_uv.get_buffer_islands(buffer)
+        else:
+            face_group = np.zeros(len(face_area_vt), dtype=np.int64)
+        count = int(face_group.max()) + 1 if len(face_group) > 0 else 0
+
+        group_area_vt, group_area_uv = utilities_texel.get_group_areas(face_area_vt, face_area_uv, face_group, count)
+        group_density = utilities_texel.get_density(group_area_vt, group_area_uv)
+        is_valid = group_density > 0
+        scale = np.where(is_valid, density / np.where(is_valid, group_density, 1), 1)
+        count_groups += np.count_nonzero(is_valid)
+        count_skipped += np.count_nonzero(~is_valid)
+
+        # Set Scale Origin to Island center or top left
+        loop_group = face_group[buffer.loop_face]
+        if mode == 'ISLAND':
+            loop_count = np.maximum(np.bincount(loop_group, minlength=count), 1)
+            pivot = np.column_stack([np.bincount(loop_group, buffer.uvs[:, i], minlength=count) / loop_count for i in range(2)])
+        else:
+            pivot = np.tile((0.0, 1.0), (count, 1))
+
+        pivot = pivot[loop_group]
+        buffer.uvs[:] = pivot + (buffer.uvs - pivot) * scale[loop_group][:, None]
+        buffer.write_uvs()
+
+    elapsed = time.time() - time_start
+    print("Normalized {}x meshes in {:.2f}s".format(len(mesh_objects), elapsed))
+
+    count_objects = sum(len(objects) for objects in mesh_objects.values())
+    message = "{}x {} scaled on {}x meshes of {}x objects in {:.2f}s".format(
+        count_groups, "islands" if mode == 'ISLAND' else "UV maps", len(mesh_objects), count_objects, elapsed)
+    if count_skipped > 0:
+        message += ", {}x without area skipped".format(count_skipped)
+    self.report({'INFO'}, message)
+
+
+
+bpy.utils.register_class(op)
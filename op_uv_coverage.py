@@ -0,0 +1,137 @@
+import bpy
+import bmesh
+import operator
+import numpy as np
+
+from . import settings
+from . import utilities_uv
+from . import utilities_uv_raster
+
+image_name = "TT_coverage"
+
+# Preview colors of empty, single and overlapping texels
+color_empty = (0.1, 0.1, 0.1, 1.0)
+color_single = (0.2, 0.6, 0.2, 1.0)
+color_overlap = (0.9, 0.15, 0.1, 1.0)
+
+
+class op(bpy.types.Operator):
+    bl_idname = "uv.textools_uv_coverage"
+    bl_label = "UV Coverage"
+    bl_description = "Rasterize the UVs at the texture size to measure the used UV space and overlapping texels"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    preview : bpy.props.BoolProperty(name="Preview Image", description="Show the coverage as an image in the UV editor", default=False)
+
+    @classmethod
+    def poll(cls, context):
+        if not bpy.context.active_object:
+            return False
+
+        if bpy.context.active_object.type != 'MESH':
+            return False
+
+        ##Requires UV map
+        if not bpy.context.object.data.uv_layers:
+            return False
+
+        return True
+
+
+    def execute(self, context):
+        coverage(self, context)
+        return {'FINISHED'}
+
+
+
+def coverage(self, context):
+    width = bpy.context.scene.texToolsSettings.size[0]
+    height = bpy.context.scene.texToolsSettings.size[1]
+
+    buffer = utilities_uv.get_buffer()
+    if buffer == None:
+        self.report({'ERROR_INVALID_INPUT'}, "No UV maps found")
+        return
+
+    # Island of each face, over all faces of the UV layers
+    face_island = np.empty(len(buffer.face_loop_total), dtype=np.int64)
+    count_islands = 0
+    for obj, face_offset in zip(buffer.objects, buffer.face_offsets):
+        if obj.mode == 'EDIT':
+            bm = bmesh.from_edit_mesh(obj.data)
+        else:
+            bm = bmesh.new()
+            bm.from_mesh(obj.data)
+        uv_layers = bm.loops.layers.uv.verify()
+
+        index = utilities_uv.get_island_index(bm, uv_layers, obj.data)
+        for island in index.islands:
+            face_island[np.array(island, dtype=np.int64) + face_offset] = count_islands
+            count_islands += 1
+
+        if obj.mode != 'EDIT':
+            bm.free()
+
+    # Rasterize all triangles in texel space
+    triangle_loops, triangle_faces = buffer.get_loop_triangles()
+    triangles = buffer.uvs[triangle_loops].astype(np.float64) * (width, height)
+    spans = utilities_uv_raster.get_triangle_spans(triangles, width, height)
+    counts = utilities_uv_raster.get_coverage(spans, width, height)
+
+    is_overlap = counts > 1
+    count_used = int(np.count_nonzero(counts))
+    count_overlap = int(np.count_nonzero(is_overlap))
+
+    # Overlapping texels covered by each island
+    span_overlap = utilities_uv_raster.get_spans_sum(spans, is_overlap)
+    island_overlap = np.bincount(face_island[triangle_faces[spans[0]]], weights=span_overlap, minlength=count_islands).astype(np.int64)
+
+    settings.coverage = {
+        'size': (width, height),
+        'utilization': 100.0 * count_used / max(width * height, 1),
+        'overlap': count_overlap,
+        'islands': count_islands,
+        'islands_overlap': island_overlap
+    }
+
+    for island_id in np.flatnonzero(island_overlap).tolist():
+        print("Island #{} overlaps {}x texels".format(island_id, island_overlap[island_id]))
+
+    if self.preview:
+        preview_image(counts, width, height)
+
+    self.report({'INFO'}, "UV coverage {:.1f}%, {}x texels overlap in {}x of {}x islands".format(
+        settings.coverage['utilization'], count_overlap, np.count_nonzero(island_overlap), count_islands
+    ))
+
+
+
+def preview_image(counts, width, height):
+    # Image already exists?
+    if image_name in bpy.data.images:
+        image = bpy.data.images[image_name]
+        if image.size[0] != width or image.size[1] != height:
+            image.scale(width, height)
+    else:
+        image = bpy.data.images.new(image_name, width=width, height=height)
+
+    # Rows of the coverage start at the bottom like the image pixels
+    pixels = np.empty((height, width, 4), dtype=np.float32)
+    pixels[:] = color_empty
+    pixels[counts == 1] = color_single
+    pixels[counts > 1] = color_overlap
+
+    if hasattr(image.pixels, 'foreach_set'):
+        image.pixels.foreach_set(pixels.ravel())
+    else:
+        image.pixels[:] = pixels.ravel()
+    image.update()
+
+    # Set background image
+    for area in bpy.context.screen.areas:
+        if area.type == 'IMAGE_EDITOR':
+            area.spaces[0].image = image
+
+
+
+bpy.utils.register_class(op)
@@ -1,17 +1,13 @@
-import bpy
-import bmesh
-import operator
-
-selection_uv_mode = '';
-selection_uv_loops = []
-selection_uv_pivot = '';
-selection_uv_pivot_pos = (0,0)
-
-selection_mode = [False, False, True];
-selection_vert_indexies = []
-selection_face_indexies = []
-
-bake_render_engine = ''
-bake_objects_hide_render = [] 
-bake_cycles_samples = 1
-sets = []
\ No newline at end of file
+import bpy
+import bmesh
+import operator
+
+selection_snapshots = []
+selection_snapshots_max = 8
+
+bake_render_engine = ''
+bake_objects_hide_render = [] 
+bake_cycles_samples = 1
+sets = []
+coverage = None
+texel_heatmap = None
@@ -0,0 +1,9 @@
+import pytest
+
+
+# The repository root is the add-on package, its __init__ imports bpy.
+# Collected as a plain directory, pytest does not import it to set up the tests inside.
+
+def pytest_collect_directory(path, parent):
+    if (path / "__init__.py").is_file() and (path / "tests").is_dir():
+        return pytest.Dir.from_parent(parent, path=path)
@@ -0,0 +1,85 @@
+import os
+import time
+import importlib.util
+import numpy as np
+
+
+spec = importlib.util.spec_from_file_location("utilities_uv_cluster", os.path.join(os.path.dirname(__file__), "..", "utilities_uv_cluster.py"))
+utilities_uv_cluster = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(utilities_uv_cluster)
+
+
+
+def get_grid(size, random):
+    """Loop arrays of a quad grid with scrambled face order and loop start, the UVs are split into four quadrant islands"""
+    faces = random.permutation(size * size)
+    x, y = faces % size, faces // size
+
+    # Corners of every quad, counter clockwise and rotated by a random start
+    corners = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+    shift = random.randint(0, 4, len(faces))
+    corners = corners[(np.arange(4)[None, :] + shift[:, None]) % 4]
+    corner_x = x[:, None] + corners[:, :, 0]
+    corner_y = y[:, None] + corners[:, :, 1]
+    loop_vert = (corner_y * (size + 1) + corner_x).ravel()
+
+    # Each quadrant is moved apart in UV space, which cuts the seams
+    quadrant = (x >= size // 2).astype(int) + 2 * (y >= size // 2)
+    uvs = np.column_stack((corner_x.ravel() / size + 2 * np.repeat(quadrant % 2, 4), corner_y.ravel() / size + 2 * np.repeat(quadrant // 2, 4)))
+
+    loop_face = np.repeat(np.arange(len(faces)), 4)
+    face_loop_start = np.arange(len(faces)) * 4
+    face_loop_total = np.full(len(faces), 4)
+    return uvs.astype(np.float32), loop_vert, loop_face, face_loop_start, face_loop_total, quadrant
+
+
+
+def test_face_islands_grid():
+    uvs, loop_vert, loop_face, face_loop_start, face_loop_total, quadrant = get_grid(8, np.random.RandomState(4))
+    islands = utilities_uv_cluster.get_face_islands(uvs, loop_vert, loop_face, face_loop_start, face_loop_total)
+
+    # One island per quadrant, numbered by their first face
+    assert islands.max() == 3
+    assert islands[0] == 0
+    for i in range(4):
+        assert len(np.unique(islands[quadrant == i])) == 1
+
+
+
+def test_face_islands_mesh_scale():
+    # A 250k face mesh in scrambled order, like a dense scan or a decimated sculpt
+    uvs, loop_vert, loop_face, face_loop_start, face_loop_total, quadrant = get_grid(500, np.random.RandomState(5))
+
+    time_start = time.time()
+    islands = utilities_uv_cluster.get_face_islands(uvs, loop_vert, loop_face, face_loop_start, face_loop_total)
+    assert time.time() - time_start < 20
+
+    assert islands.max() == 3
+    for i in range(4):
+        assert len(np.unique(islands[quadrant == i])) == 1
+
+
+
+def test_face_islands_non_manifold():
+    # Random triangles on few verts share edges between many faces, compared with linking every pair of loops by hand
+    random = np.random.RandomState(6)
+    for i in range(30):
+        count_faces = random.randint(1, 40)
+        loop_vert = np.concatenate([random.choice(6, 3, replace=False) for face in range(count_faces)])
+        uvs = (random.randint(0, 2, (len(loop_vert), 2)) * 0.5).astype(np.float32)
+        uvs[:] = (loop_vert[:, None] % 3) * 0.25 + uvs * (random.rand() < 0.5)
+        loop_face = np.repeat(np.arange(count_faces), 3)
+        face_loop_start = np.arange(count_faces) * 3
+        face_loop_total = np.full(count_faces, 3)
+        islands = utilities_uv_cluster.get_face_islands(uvs, loop_vert, loop_face, face_loop_start, face_loop_total)
+
+        loop_next = np.arange(len(loop_vert)) + 1
+        loop_next[face_loop_start + 2] = face_loop_start
+        sides = {}
+        for loop in range(len(loop_vert)):
+            side = sorted([(loop_vert[loop], tuple(uvs[loop])), (loop_vert[loop_next[loop]], tuple(uvs[loop_next[loop]]))])
+            sides.setdefault(tuple(side), []).append(loop_face[loop])
+        pairs_a = [faces[0] for faces in sides.values() for face in faces[1:]]
+        pairs_b = [face for faces in sides.values() for face in faces[1:]]
+        expected = utilities_uv_cluster.get_labels_ordered(utilities_uv_cluster.get_components(count_faces, pairs_a, pairs_b))
+        assert np.array_equal(islands, expected)
@@ -0,0 +1,78 @@
+import os
+import importlib.util
+import numpy as np
+
+
+# The module only needs numpy, it is loaded from its file so Blender is not required
+spec = importlib.util.spec_from_file_location("utilities_uv_cluster", os.path.join(os.path.dirname(__file__), "..", "utilities_uv_cluster.py"))
+utilities_uv_cluster = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(utilities_uv_cluster)
+
+
+
+def get_components_reference(count, pairs_a, pairs_b):
+    # Plain union find, labels are the lowest index of each component
+    parent = list(range(count))
+
+    def find(element):
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    for a, b in zip(pairs_a, pairs_b):
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    return np.array([find(element) for element in range(count)], dtype=np.int64)
+
+
+
+def test_components_random_graphs():
+    random = np.random.RandomState(1)
+    for i in range(50):
+        count = random.randint(1, 300)
+        links = random.randint(0, 400)
+        pairs_a = random.randint(0, count, links)
+        pairs_b = random.randint(0, count, links)
+        labels = utilities_uv_cluster.get_components(count, pairs_a, pairs_b)
+        assert np.array_equal(labels, get_components_reference(count, pairs_a.tolist(), pairs_b.tolist()))
+
+
+
+def test_components_empty():
+    assert len(utilities_uv_cluster.get_components(0, [], [])) == 0
+    assert np.array_equal(utilities_uv_cluster.get_components(3, [], []), [0, 1, 2])
+
+
+
+def test_components_long_permuted_chain():
+    random = np.random.RandomState(2)
+    count = 100000
+    chain = random.permutation(count)
+    order = random.permutation(count - 1)
+    labels = utilities_uv_cluster.get_components(count, chain[:-1][order], chain[1:][order])
+    assert np.all(labels == 0)
+
+
+
+def test_components_scrambled_grid():
+    random = np.random.RandomState(3)
+    size = 600
+    grid = random.permutation(size * size).reshape(size, size)
+
+    # Cut the grid in two halves
+    pairs_a = np.concatenate((grid[:, :-1].ravel(), grid[:-1, :].ravel()))
+    pairs_b = np.concatenate((grid[:, 1:].ravel(), grid[1:, :].ravel()))
+    keep = ~np.isin(np.arange(len(pairs_a)), np.arange(size // 2 - 1, size * (size - 1), size - 1)[:size])
+    labels = utilities_uv_cluster.get_components(size * size, pairs_a[keep], pairs_b[keep])
+
+    assert np.all(labels[grid[:, :size // 2]] == grid[:, :size // 2].min())
+    assert np.all(labels[grid[:, size // 2:]] == grid[:, size // 2:].min())
+
+
+
+def test_clusters():
+    points = [(0, 0), (0.5, 0.5), (0, 0.00000005), (1, 1), (0.5, 0.50000008)]
+    assert np.array_equal(utilities_uv_cluster.get_clusters(points), [0, 1, 0, 2, 1])
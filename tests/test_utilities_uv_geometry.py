@@ -0,0 +1,56 @@
+import os
+import math
+import time
+import importlib.util
+import numpy as np
+
+
+spec = importlib.util.spec_from_file_location("utilities_uv_geometry", os.path.join(os.path.dirname(__file__), "..", "utilities_uv_geometry.py"))
+utilities_uv_geometry = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(utilities_uv_geometry)
+
+
+
+def get_bounds_reference(hull):
+    """Smallest area and width of the rectangles with one side on a hull edge, every edge against every point"""
+    areas = []
+    widths = []
+    for i in range(len(hull)):
+        direction = hull[(i + 1) % len(hull)] - hull[i]
+        length = np.linalg.norm(direction)
+        direction = direction / length if length > 0 else np.array([1.0, 0.0])
+        u = hull @ direction
+        v = hull @ np.array([-direction[1], direction[0]])
+        width, height = u.max() - u.min(), v.max() - v.min()
+        areas.append(width * height)
+        widths.append(min(width, height))
+    return min(areas), min(widths)
+
+
+
+def test_minimal_bounds_random():
+    random = np.random.RandomState(1)
+    islands = [random.rand(random.randint(1, 40), 2) * random.rand(2) for i in range(200)]
+    counts = np.array([len(island) for island in islands])
+    offsets = np.cumsum(counts) - counts
+    hulls, hull_offsets, hull_counts = utilities_uv_geometry.get_convex_hulls(np.concatenate(islands), offsets, counts)
+
+    angles, sizes_area = utilities_uv_geometry.get_minimal_bounds(hulls, hull_offsets, hull_counts, 'AREA')
+    angles, sizes_width = utilities_uv_geometry.get_minimal_bounds(hulls, hull_offsets, hull_counts, 'WIDTH')
+    for i in range(len(islands)):
+        area, width = get_bounds_reference(hulls[hull_offsets[i]:hull_offsets[i] + hull_counts[i]])
+        assert math.isclose(sizes_area[i, 0] * sizes_area[i, 1], area, abs_tol=1e-12)
+        assert math.isclose(sizes_width[i, 1], width, abs_tol=1e-12)
+        assert sizes_area[i, 0] >= sizes_area[i, 1]
+
+
+
+def test_minimal_bounds_round_island():
+    # A round island has a hull point per vertex, pairing every edge with every point would not fit in memory
+    angles = np.linspace(0, 2 * math.pi, 200000, endpoint=False)
+    ellipse = np.column_stack((np.cos(angles) * 2, np.sin(angles)))
+
+    time_start = time.time()
+    angle = utilities_uv_geometry.get_rotation_minimal_bounds(ellipse)
+    assert time.time() - time_start < 10
+    assert abs(angle) < 0.001
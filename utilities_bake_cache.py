@@ -0,0 +1,288 @@
+import bpy
+import os
+import hashlib
+import tempfile
+import numpy as np
+
+from . import utilities_bake
+
+
+# On disk cache of baked images, keyed by a hash of everything a bake set reads.
+# Files are touched when used, so removing the oldest files first keeps the most recently used bakes.
+
+version = 2
+
+
+
+def get_folder():
+    path = bpy.context.preferences.addons["textools"].preferences.bake_cache_path
+    if path == "":
+        return os.path.join(tempfile.gettempdir(), "textools_bake_cache")
+    return bpy.path.abspath(path)
+
+
+
+def get_path(key):
+    # 32 bit bakes are part of the key, so each key has one file format
+    is_float_32 = bpy.context.preferences.addons["textools"].preferences.bake_32bit_float == '32'
+    return os.path.join(get_folder(), key + (".exr" if is_float_32 else ".png"))
+
+
+
+def get_set_key(set, mode, bake_mode, size, sampling_scale, samples, ray_distance):
+    """Hash of the objects of the set and the bake settings, equal keys bake into equal images"""
+    props = bpy.context.scene.texToolsSettings
+    preferences = bpy.context.preferences.addons["textools"].preferences
+
+    hash = hashlib.sha1()
+    update(hash, (
+        version,
+        bpy.app.version,
+        mode,
+        bake_mode.material,
+        bake_mode.type,
+        bake_mode.normal_space,
+        tuple(bake_mode.color),
+        bake_mode.engine,
+        bake_mode.composite,
+        tuple(getattr(props, param) for param in bake_mode.params),
+        tuple(size),
+        sampling_scale,
+        samples,
+        ray_distance,
+        props.padding,
+        preferences.bake_32bit_float,
+        preferences.swizzle_y_coordinate
+    ))
+
+    objects = set.objects_low + set.objects_cage + set.objects_high + set.objects_float
+    for role, role_objects in (('low', set.objects_low), ('cage', set.objects_cage), ('high', set.objects_high), ('float', set.objects_float)):
+        for obj in role_objects:
+            update(hash, role)
+            update_object(hash, obj, bake_mode.setVColor != None)
+
+    # Ambient occlusion uses the distance of the world and also sees the other objects of the scene
+    if bake_mode.type == 'AO':
+        world = bpy.context.scene.world
+        update(hash, get_properties(world.light_settings) if world else None)
+        if not props.bake_exclude_others:
+            for obj in sorted(bpy.context.view_layer.objects, key=lambda obj: obj.name):
+                if obj.type == 'MESH' and not obj.hide_render and obj not in objects:
+                    update(hash, (obj.name, get_matrix(obj), len(obj.data.vertices), len(obj.data.polygons)))
+
+    return hash.hexdigest()
+
+
+
+def update(hash, value):
+    if isinstance(value, np.ndarray):
+        hash.update(value.tobytes())
+    else:
+        hash.update(repr(value).encode('utf-8'))
+
+
+
+def update_object(hash, obj, is_vertex_color_baked):
+    mesh = obj.data
+    update(hash, (
+        obj.name,
+        get_matrix(obj),
+        len(mesh.vertices),
+        len(mesh.loops),
+        len(mesh.polygons),
+        mesh.use_auto_smooth,
+        mesh.auto_smooth_angle,
+        mesh.uv_layers.active.name if mesh.uv_layers.active else None
+    ))
+
+    update(hash, get_array(mesh.vertices, "co", np.float32, 3))
+    update(hash, get_array(mesh.loops, "vertex_index", np.int32))
+    update(hash, get_array(mesh.polygons, "loop_start", np.int32))
+    update(hash, get_array(mesh.polygons, "use_smooth", bool))
+    update(hash, get_array(mesh.polygons, "material_index", np.int32))
+    update(hash, get_array(mesh.edges, "use_edge_sharp", bool))
+    if mesh.uv_layers.active:
+        update(hash, get_array(mesh.uv_layers.active.data, "uv", np.float32, 2))
+    if is_vertex_color_baked:
+        # Vertex colors are written by the bake from the selection and materials
+        update(hash, get_array(mesh.polygons, "select", bool))
+    else:
+        for layer in mesh.vertex_colors:
+            update(hash, layer.name)
+            update(hash, get_array(layer.data, "color", np.float32, 4))
+    if mesh.has_custom_normals:
+        mesh.calc_normals_split()
+        update(hash, get_array(mesh.loops, "normal", np.float32, 3))
+    if mesh.shape_keys:
+        for block in mesh.shape_keys.key_blocks:
+            update(hash, (block.name, block.value, block.mute))
+            update(hash, get_array(block.data, "co", np.float32, 3))
+
+    for modifier in obj.modifiers:
+        update(hash, get_properties(modifier))
+
+    for slot in obj.material_slots:
+        update(hash, get_material(slot.material))
+
+
+
+def get_array(collection, attribute, dtype, width=1):
+    array = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attribute, array)
+    return array
+
+
+
+def get_matrix(obj):
+    return tuple(value for row in obj.matrix_world for value in row)
+
+
+
+# Properties that change without changing the bake
+properties_ignored = {
+    'rna_type', 'show_expanded', 'users', 'use_fake_user', 'tag', 'is_evaluated', 'original',
+    'is_library_indirect', 'is_runtime_data', 'is_embedded_data', 'preview', 'session_uid', 'name_full'
+}
+
+
+
+def get_properties(struct, depth=0):
+    # Values of all RNA properties, with the content of the data they point to
+    values = [struct.bl_rna.identifier]
+    for prop in struct.bl_rna.properties:
+        if prop.identifier in properties_ignored or prop.type == 'COLLECTION':
+            continue
+
+        value = getattr(struct, prop.identifier)
+        if prop.type == 'POINTER':
+            value = get_pointer(value, depth)
+        elif prop.type == 'ENUM' and prop.is_enum_flag:
+            value = tuple(sorted(value))
+        elif getattr(prop, "array_length", 0) > 0:
+            value = tuple(value)
+        values.append((prop.identifier, value))
+
+    return tuple(values)
+
+
+
+def get_pointer(value, depth):
+    # Referenced data changes the bake without changing the modifier, so its content is part of the key
+    if value is None:
+        return None
+    if isinstance(value, bpy.types.Object):
+        return get_referenced_object(value)
+    if isinstance(value, bpy.types.Collection):
+        return (value.name, tuple(get_referenced_object(obj) for obj in sorted(value.all_objects, key=lambda obj: obj.name)))
+    if isinstance(value, bpy.types.Image):
+        return get_image(value)
+    if isinstance(value, bpy.types.ID):
+        # Textures and other data blocks by their settings
+        if depth > 0:
+            return value.name
+        return (value.name, get_properties(value, depth + 1))
+    if depth < 2:
+        # Nested settings of the modifier
+        return get_properties(value, depth + 1)
+    return None
+
+
+
+def get_referenced_object(obj):
+    # Transform and evaluated mesh, which includes the modifiers of the referenced object
+    key = [obj.name, get_matrix(obj)]
+    if obj.type in ('MESH', 'CURVE', 'SURFACE', 'FONT', 'META'):
+        evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        mesh = evaluated.to_mesh()
+        if mesh:
+            key.append(hashlib.sha1(get_array(mesh.vertices, "co", np.float32, 3).tobytes() + get_array(mesh.loops, "vertex_index", np.int32).tobytes()).hexdigest())
+        evaluated.to_mesh_clear()
+    return tuple(key)
+
+
+
+def get_image(image):
+    # Saved files by their path and modification time, painted, packed or generated images by their pixels
+    path = bpy.path.abspath(image.filepath, library=image.library)
+    if image.source == 'FILE' and not image.is_dirty and not image.packed_file and os.path.isfile(path):
+        stat = os.stat(path)
+        return (image.name, path, stat.st_mtime, stat.st_size, image.colorspace_settings.name)
+
+    if hasattr(image.pixels, 'foreach_get'):
+        pixels = np.empty(len(image.pixels), dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+    else:
+        pixels = np.array(image.pixels[:], dtype=np.float32)
+    return (image.name, image.source, image.colorspace_settings.name, tuple(image.size), hashlib.sha1(pixels.tobytes()).hexdigest())
+
+
+
+def get_material(material):
+    # Materials are replaced for most bakes, but bump and color inputs still reach the normal and diffuse bakes
+    if material is None:
+        return None
+    if not material.use_nodes or not material.node_tree:
+        return (material.name, tuple(material.diffuse_color))
+
+    nodes = []
+    for node in material.node_tree.nodes:
+        # The image node the bake itself adds
+        if node.name == "bake":
+            continue
+
+        inputs = []
+        for socket in node.inputs:
+            if hasattr(socket, "default_value"):
+                value = socket.default_value
+                inputs.append(tuple(value) if hasattr(value, "__len__") else value)
+        image = getattr(node, "image", None)
+        nodes.append((node.bl_idname, node.name, tuple(inputs), get_image(image) if image else None))
+
+    links = [(link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier) for link in material.node_tree.links]
+    return (material.name, tuple(sorted(nodes)), tuple(sorted(links)))
+
+
+
+def get_cached(key):
+    """Path of the cached image of the key or None, a hit marks the file as recently used"""
+    path = get_path(key)
+    if not os.path.isfile(path):
+        return None
+
+    os.utime(path)
+    return path
+
+
+
+def store(key, image):
+    # A temporary copy is saved, saving the bake image itself would turn it into a file image and clear its unsaved state
+    path = get_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    copy = bpy.data.images.new("TT_bake_cache", width=image.size[0], height=image.size[1], alpha=True, float_buffer=image.is_float)
+    copy.colorspace_settings.name = image.colorspace_settings.name
+    utilities_bake.copy_pixels(image, copy)
+    copy.filepath_raw = path
+    copy.file_format = 'OPEN_EXR' if path.endswith(".exr") else 'PNG'
+    copy.save()
+    bpy.data.images.remove(copy)
+
+    evict(bpy.context.preferences.addons["textools"].preferences.bake_cache_size * 1024 * 1024)
+
+
+
+def evict(size_max):
+    # Remove the least recently used images until the cache fits
+    folder = get_folder()
+    files = []
+    for entry in os.scandir(folder):
+        if entry.is_file():
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+    size = sum(file[1] for file in files)
+    for mtime, file_size, path in sorted(files):
+        if size <= size_max:
+            break
+        os.remove(path)
+        size -= file_size
@@ -0,0 +1,224 @@
+import bpy
+import os
+import sys
+import json
+import time
+import fnmatch
+
+from . import settings
+from . import utilities_bake as ub
+from . import op_bake
+
+
+# Headless baking from a manifest file, for build pipelines:
+#
+#   blender -b scene.blend --addons textools --python-exit-code 1
+#       --python-expr "import textools.utilities_bake_cli as cli; cli.main()" -- bake.json
+#
+# Manifest (JSON, or TOML where a TOML module is available):
+#
+#   {
+#       "modes": ["normal_tangent", "ao"],
+#       "size": [1024, 1024],
+#       "sampling": 2,
+#       "samples": 64,
+#       "ray_distance": 0.01,
+#       "padding": 4,
+#       "cache": true,
+#       "parameters": {"bake_curvature_size": 2},
+#       "output": "//textures/{set}_{mode}.tga",
+#       "report": "//bake_report.json",
+#       "sets": [
+#           {"name": "chair", "low": "chair_low", "high": ["chair_high*"], "cage": [], "float": []},
+#           {"objects": ["table*"]}
+#       ]
+#   }
+#
+# Object names are fnmatch patterns. Sets given by "objects" are grouped by name like a selection in the UI.
+# Relative paths start at the manifest, '//' at the blend file. The report is printed as the last line of the output.
+
+
+file_formats = {
+    '.tga': 'TARGA',
+    '.png': 'PNG',
+    '.exr': 'OPEN_EXR',
+    '.tif': 'TIFF',
+    '.tiff': 'TIFF',
+    '.jpg': 'JPEG'
+}
+
+
+
+def main():
+    """Bake the manifest passed after '--' and exit with code 1 if anything failed"""
+    path_manifest = os.path.abspath(sys.argv[sys.argv.index("--") + 1])
+    report = bake_manifest(load_manifest(path_manifest), os.path.dirname(path_manifest))
+
+    print(json.dumps(report))
+    if len(report['errors']) > 0:
+        sys.exit(1)
+
+
+
+def load_manifest(path):
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    if os.path.splitext(path)[1].lower() != '.toml':
+        return json.loads(data.decode('utf-8'))
+
+    # TOML is only part of newer Python versions
+    try:
+        import tomllib
+        return tomllib.loads(data.decode('utf-8'))
+    except ImportError:
+        pass
+    try:
+        import toml
+        return toml.loads(data.decode('utf-8'))
+    except ImportError:
+        raise RuntimeError("No TOML module available in this Python, use a JSON manifest instead")
+
+
+
+def bake_manifest(manifest, folder):
+    """Bake all sets and modes of the manifest, returns the timing report"""
+    time_start = time.time()
+    report = {
+        'file': bpy.data.filepath,
+        'sets': [],
+        'errors': [],
+        'seconds': 0
+    }
+
+    props = bpy.context.scene.texToolsSettings
+    props.padding = manifest.get('padding', props.padding)
+    for key, value in manifest.get('parameters', {}).items():
+        if not hasattr(props, key):
+            report['errors'].append("Unknown parameter '{}'".format(key))
+            continue
+        setattr(props, key, value)
+
+    modes = manifest.get('modes', [])
+    for mode in modes:
+        if mode not in op_bake.modes:
+            report['errors'].append("Uknown mode '{}' only available: '{}'".format(mode, ", ".join(op_bake.modes.keys())))
+
+    sets = []
+    for set_manifest in manifest.get('sets', []):
+        found, errors = get_sets(set_manifest)
+        sets.extend(found)
+        report['errors'].extend(errors)
+
+    if len(report['errors']) == 0:
+        size = manifest.get('size', list(props.size))
+        output = manifest.get('output', "//{set}_{mode}.tga")
+        for set in sets:
+            for mode in modes:
+                result = bake_set(
+                    set,
+                    mode,
+                    size,
+                    int(manifest.get('sampling', 1)),
+                    manifest.get('samples', props.bake_samples),
+                    manifest.get('ray_distance', props.bake_ray_distance),
+                    get_path(output.format(set=set.name, mode=mode), folder),
+                    manifest.get('cache', False)
+                )
+                report['sets'].append(result)
+                report['errors'].extend(result['errors'])
+
+    report['seconds'] = round(time.time() - time_start, 3)
+
+    path_report = manifest.get('report')
+    if path_report:
+        path_report = get_path(path_report, folder)
+        os.makedirs(os.path.dirname(path_report), exist_ok=True)
+        with open(path_report, 'w') as file:
+            json.dump(report, file, indent=4)
+
+    return report
+
+
+
+def get_sets(set_manifest):
+    """Bake sets of a manifest entry and the errors found resolving it"""
+    if 'objects' in set_manifest:
+        # Grouped by name like a selection in the UI
+        objects = get_objects(set_manifest['objects'])
+        if len(objects) == 0:
+            return [], ["No objects match '{}'".format(set_manifest['objects'])]
+
+        for obj in bpy.context.view_layer.objects:
+            obj.select_set(state=obj in objects, view_layer=None)
+        return ub.get_bake_sets(), []
+
+    objects = {}
+    for key in ('low', 'cage', 'high', 'float'):
+        objects[key] = get_objects(set_manifest.get(key, []))
+
+    if len(objects['low']) == 0:
+        return [], ["No low poly objects match '{}'".format(set_manifest.get('low'))]
+
+    name = set_manifest.get('name') or ub.get_set_name(objects['low'][0])
+    return [ub.BakeSet(name, objects['low'], objects['cage'], objects['high'], objects['float'])], []
+
+
+
+def get_objects(patterns):
+    # Mesh objects matching any of the name patterns, in name order
+    if isinstance(patterns, str):
+        patterns = [patterns]
+
+    objects = []
+    for obj in sorted(bpy.context.view_layer.objects, key=lambda obj: obj.name):
+        if obj.type == 'MESH' and any(fnmatch.fnmatchcase(obj.name, pattern) for pattern in patterns):
+            objects.append(obj)
+    return objects
+
+
+
+def get_path(path, folder):
+    if path.startswith("//"):
+        return bpy.path.abspath(path)
+    return os.path.join(folder, path)
+
+
+
+def bake_set(set, mode, size, sampling_scale, samples, ray_distance, path, use_cache=False):
+    """Bake one set in one mode and save the image, returns the timing entry of the report"""
+    time_start = time.time()
+    report = ub.BakeReport()
+
+    # Same scene preparation as the Bake operator
+    settings.sets = [set]
+    ub.store_bake_settings()
+    op_bake.bake(
+        self=report,
+        mode=mode,
+        size=size,
+        bake_single=False,
+        sampling_scale=sampling_scale,
+        samples=samples,
+        ray_distance=ray_distance,
+        use_cache=use_cache
+    )
+    ub.restore_bake_settings()
+
+    if len(report.errors) == 0:
+        image = bpy.data.images["{}_{}".format(set.name, mode)]
+        image.file_format = file_formats.get(os.path.splitext(path)[1].lower(), 'TARGA')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        image.filepath_raw = path
+        image.save()
+
+    elapsed = time.time() - time_start
+    print("Baked '{}' '{}' in {:.2f}s = {}".format(set.name, mode, elapsed, path))
+
+    return {
+        'name': set.name,
+        'mode': mode,
+        'path': path,
+        'seconds': round(elapsed, 3),
+        'errors': report.errors
+    }
@@ -0,0 +1,209 @@
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from collections import OrderedDict
+
+
+# Number of mesh UV layers to keep island data for, least recently used are dropped first
+max_entries = 8
+
+# (mesh pointer, uv layer name) -> IslandIndex
+cache = OrderedDict()
+
+# (mesh pointer, uv layer name, owner name) -> FaceCache
+face_caches = OrderedDict()
+
+
+
+class IslandIndex:
+    """Face to island map of all faces of a mesh UV layer.
+    Hashes per island are filled in lazily by utilities_uv.
+    Bounds are not kept: operators move islands in their UV buffer and then read the bounds again before anything is written,
+    so cached bounds would be stale within one call. get_island_bounds_arrays reduces the buffer in one pass instead."""
+
+    def __init__(self, signature, islands):
+        # Topology counts when built, a mismatch means the index is outdated
+        self.signature = signature
+
+        # Face indices per island
+        self.islands = islands
+
+        self.face_island = {}
+        for island_id, island in enumerate(islands):
+            for index in island:
+                self.face_island[index] = island_id
+
+        # island id -> topology hash, area and perimeter
+        self.hashes = {}
+
+
+    def get_island_id(self, faces):
+        # Returns the id if the faces are a complete island of this index
+        if len(faces) == 0:
+            return None
+        island_id = self.face_island.get(faces[0].index)
+        if island_id is None or len(self.islands[island_id]) != len(faces):
+            return None
+        return island_id
+
+
+
+class FaceCache:
+    """Values per face and island of a mesh UV layer with the mesh data they were computed from.
+    The data is compared on every update instead of waiting for depsgraph updates,
+    so writing results like vertex colors back to the mesh keeps the values."""
+
+    def __init__(self):
+        self.settings = None
+        self.uvs = None
+        self.co = None
+        self.loop_vert = None
+        self.face_loop_start = None
+        self.face_loop_total = None
+
+        # Island id per buffer face, dropped when any UV changed
+        self.face_island = None
+
+        # name -> values filled in by the owner, dropped when all faces changed
+        self.values = {}
+
+
+    def update(self, buffer, co, settings):
+        """Faces whose UVs or vertex positions changed since the last update, all faces when the topology or the settings changed"""
+        is_same_topology = (
+            self.settings == settings and
+            self.co is not None and
+            self.co.shape == co.shape and
+            np.array_equal(self.loop_vert, buffer.loop_vert) and
+            np.array_equal(self.face_loop_start, buffer.face_loop_start) and
+            np.array_equal(self.face_loop_total, buffer.face_loop_total)
+        )
+
+        if is_same_topology:
+            loops_moved = (self.uvs != buffer.uvs).any(axis=1)
+            if loops_moved.any():
+                self.face_island = None
+            loops_moved |= (self.co != co).any(axis=1)[buffer.loop_vert]
+            faces = np.unique(buffer.loop_face[loops_moved])
+        else:
+            faces = np.arange(len(buffer.face_loop_total))
+            self.face_island = None
+            self.values = {}
+
+        self.settings = settings
+        self.uvs = buffer.uvs.copy()
+        self.co = co.copy()
+        self.loop_vert = buffer.loop_vert.copy()
+        self.face_loop_start = buffer.face_loop_start.copy()
+        self.face_loop_total = buffer.face_loop_total.copy()
+        return faces
+
+
+
+def get_face_cache(mesh, uv_name, name):
+    """Face cache of a mesh UV layer for one owner, created when missing"""
+    key = get_key(mesh, uv_name) + (name,)
+    entry = face_caches.get(key)
+    if entry is None:
+        entry = FaceCache()
+        face_caches[key] = entry
+    face_caches.move_to_end(key)
+
+    while len(face_caches) > max_entries:
+        face_caches.popitem(last=False)
+    return entry
+
+
+
+def get_key(mesh, uv_name):
+    return (mesh.as_pointer(), uv_name)
+
+
+
+def get(mesh, uv_name, signature):
+    key = get_key(mesh, uv_name)
+    index = cache.get(key)
+    if index is None:
+        return None
+
+    if index.signature != signature:
+        del cache[key]
+        return None
+
+    cache.move_to_end(key)
+    return index
+
+
+
+def store(mesh, uv_name, index):
+    key = get_key(mesh, uv_name)
+    cache[key] = index
+    cache.move_to_end(key)
+
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+
+def invalidate(mesh=None):
+    # Drop cached islands of a mesh or of all meshes
+    pointer = mesh.as_pointer() if mesh else None
+    for key in list(cache.keys()):
+        if pointer is None or key[0] == pointer:
+            del cache[key]
+
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph=None):
+    if len(cache) == 0:
+        return
+
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            if data.type != 'MESH':
+                continue
+            data = data.data
+
+        if isinstance(data, bpy.types.Mesh):
+            invalidate(data)
+
+
+
+@persistent
+def on_reset(*args):
+    # Undo, redo and file loading can swap the mesh data underneath
+    cache.clear()
+    face_caches.clear()
+
+
+
+handlers = (
+    (bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+    (bpy.app.handlers.undo_post, on_reset),
+    (bpy.app.handlers.redo_post, on_reset),
+    (bpy.app.handlers.load_post, on_reset),
+)
+
+
+
+def register():
+    for handler_list, handler in handlers:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+
+
+def unregister():
+    for handler_list, handler in handlers:
+        if handler in handler_list:
+            handler_list.remove(handler)
+    cache.clear()
+    face_caches.clear()
@@ -1,138 +1,205 @@
-import bpy
-import bmesh
-import operator
-import time
-import math
-from mathutils import Vector
-
-
-image_material_prefix = "TT_checker_"
-
-
-# Return all faces of selected objects or only selected faces
-def get_selected_object_faces():
-    object_faces_indexies = {}
-
-    previous_mode = bpy.context.object.mode
-
-    if bpy.context.object.mode == 'EDIT':
-        # Only selected Mesh faces
-        obj = bpy.context.active_object
-        if obj.type == 'MESH' and obj.data.uv_layers:
-            bm = bmesh.from_edit_mesh(obj.data)
-            bm.faces.ensure_lookup_table()
-            object_faces_indexies[obj] = [face.index for face in bm.faces if face.select]
-    else:
-        # Selected objects with all faces each
-        selected_objects = [obj for obj in bpy.context.selected_objects]
-        for obj in selected_objects:
-            if obj.type == 'MESH' and obj.data.uv_layers:
-                bpy.ops.object.mode_set(mode='OBJECT')
-                bpy.ops.object.select_all(action='DESELECT')
-                bpy.context.view_layer.objects.active = obj
-                obj.select_set( state = True, view_layer = None)
-
-                bpy.ops.object.mode_set(mode='EDIT')
-                bm = bmesh.from_edit_mesh(obj.data)
-                bm.faces.ensure_lookup_table()
-                object_faces_indexies[obj] = [face.index for face in bm.faces]
-
-    bpy.ops.object.mode_set(mode=previous_mode)
-
-    return object_faces_indexies
-
-
-
-def get_object_texture_image(obj):
-
-    previous_mode = bpy.context.active_object.mode
-    bpy.ops.object.mode_set(mode='OBJECT')
-
-    # Search in material & texture slots
-    for slot_mat in obj.material_slots:
-
-        if slot_mat.material:
-
-            # Check for traditional texture slots in material
-            for slot_tex in slot_mat.material.texture_paint_slots:
-                if slot_tex and slot_tex.texture and hasattr(slot_tex.texture , 'image'):
-                    return slot_tex.texture.image
-
-            # Check if material uses Nodes
-            if hasattr(slot_mat.material , 'node_tree'):
-                if slot_mat.material.node_tree:
-                    for node in slot_mat.material.node_tree.nodes:
-                        if type(node) is bpy.types.ShaderNodeTexImage:
-                            if node.image:
-                                return node.image
-
-    
-
-    return None
-
-
-
-def image_resize(image, size_x, size_y):
-    if image and image.source == 'FILE' or image.source == 'GENERATED':
-        image.generated_width = int(size_x)
-        image.generated_height = int(size_y)
-        image.scale( int(size_x), int(size_y) )
-    
-    
-
-def checker_images_cleanup():
-    # Clean up unused images
-    for image in bpy.data.images:
-        if image and image_material_prefix in image.name:
-            # Remove unused images
-            if not image.users:
-                image.user_clear()
-                bpy.data.images.remove(image)
-                return
-
-            # Check if name missmatches size
-            name = get_checker_name(image.generated_type , image.size[0], image.size[1])
-            if image.name != name:
-                # In cycles find related material as well
-                if image.name in bpy.data.materials:
-                    bpy.data.materials[image.name].name = name
-                image.name = name
-
-    for material in bpy.data.materials:
-        if material and image_material_prefix in material.name:
-            # Remove unused images
-            if not material.users:
-                material.user_clear()
-                bpy.data.materials.remove(material)
-
-
-
-def get_checker_name(mode, size_x, size_y):
-    return (image_material_prefix+"{1}x{2}_{0}").format(mode, size_x, size_y)
-
-
-
-def get_area_triangle_uv(A,B,C, size_x, size_y):
-    scale_x = size_x / max(size_x, size_y)
-    scale_y = size_y / max(size_x, size_y)
-    A.x/=scale_x
-    B.x/=scale_x
-    C.x/=scale_x
-    
-    A.y/=scale_y
-    B.y/=scale_y
-    C.y/=scale_y
-
-    return get_area_triangle(A,B,C)
-
-
-def get_area_triangle(A,B,C):
-    # Heron's formula: http://www.1728.org/triang.htm
-    # area = square root (s • (s - a) • (s - b) • (s - c))
-    a = (B-A).length
-    b = (C-B).length
-    c = (A-C).length
-    s = (a+b+c)/2
-
-    # Use abs(s-a) for values that otherwise generate negative values e.g. pinched UV verts, otherwise math domain error
-    return math.sqrt(s * abs(s-a) * abs(s-b) * abs(s-c))
+import bpy
+import bmesh
+import operator
+import time
+import math
+from mathutils import Vector
+import numpy as np
+
+
+image_material_prefix = "TT_checker_"
+
+
+# Return all faces of selected objects or only selected faces
+def get_selected_object_faces():
+    object_faces_indexies = {}
+
+    if bpy.context.object.mode == 'EDIT':
+        # Only selected Mesh faces of all objects in edit mode
+        for obj in bpy.context.objects_in_mode_unique_data:
+            if obj.type == 'MESH' and obj.data.uv_layers:
+                bm = bmesh.from_edit_mesh(obj.data)
+                bm.faces.index_update()
+                object_faces_indexies[obj] = [face.index for face in bm.faces if face.select]
+    else:
+        # Selected objects with all faces each, objects sharing a mesh only once
+        meshes = set()
+        for obj in bpy.context.selected_objects:
+            if obj.type == 'MESH' and obj.data.uv_layers and obj.data not in meshes:
+                meshes.add(obj.data)
+                object_faces_indexies[obj] = list(range(len(obj.data.polygons)))
+
+    return object_faces_indexies
+
+
+
+def get_object_bmesh(obj):
+    # Edit mesh in edit mode, otherwise a new BMesh of the mesh data that needs to be freed
+    if obj.mode == 'EDIT':
+        return bmesh.from_edit_mesh(obj.data)
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    return bm
+
+
+
+def get_object_texture_image(obj):
+
+    # Search in material & texture slots
+    for slot_mat in obj.material_slots:
+
+        if slot_mat.material:
+
+            # Check for traditional texture slots in material
+            for slot_tex in slot_mat.material.texture_paint_slots:
+                if slot_tex and slot_tex.texture and hasattr(slot_tex.texture , 'image'):
+                    return slot_tex.texture.image
+
+            # Check if material uses Nodes
+            if hasattr(slot_mat.material , 'node_tree'):
+                if slot_mat.material.node_tree:
+                    for node in slot_mat.material.node_tree.nodes:
+                        if type(node) is bpy.types.ShaderNodeTexImage:
+                            if node.image:
+                                return node.image
+
+    
+
+    return None
+
+
+
+def image_resize(image, size_x, size_y):
+    if image and image.source == 'FILE' or image.source == 'GENERATED':
+        image.generated_width = int(size_x)
+        image.generated_height = int(size_y)
+        image.scale( int(size_x), int(size_y) )
+    
+    
+
+def checker_images_cleanup():
+    # Clean up unused images
+    for image in bpy.data.images:
+        if image and image_material_prefix in image.name:
+            # Remove unused images
+            if not image.users:
+                image.user_clear()
+                bpy.data.images.remove(image)
+                return
+
+            # Check if name missmatches size
+            name = get_checker_name(image.generated_type , image.size[0], image.size[1])
+            if image.name != name:
+                # In cycles find related material as well
+                if image.name in bpy.data.materials:
+                    bpy.data.materials[image.name].name = name
+                image.name = name
+
+    for material in bpy.data.materials:
+        if material and image_material_prefix in material.name:
+            # Remove unused images
+            if not material.users:
+                material.user_clear()
+                bpy.data.materials.remove(material)
+
+
+
+def get_checker_name(mode, size_x, size_y):
+    return (image_material_prefix+"{1}x{2}_{0}").format(mode, size_x, size_y)
+
+
+
+def get_area_triangle_uv(A,B,C, size_x, size_y):
+    scale_x = size_x / max(size_x, size_y)
+    scale_y = size_y / max(size_x, size_y)
+
+    # Scaled copies, the UVs passed in stay untouched
+    A = Vector((A.x/scale_x, A.y/scale_y))
+    B = Vector((B.x/scale_x, B.y/scale_y))
+    C = Vector((C.x/scale_x, C.y/scale_y))
+
+    return get_area_triangle(A,B,C)
+
+
+def get_area_triangle(A,B,C):
+    # Heron's formula: http://www.1728.org/triang.htm
+    # area = square root (s • (s - a) • (s - b) • (s - c))
+    a = (B-A).length
+    b = (C-B).length
+    c = (A-C).length
+    s = (a+b+c)/2
+
+    # Use abs(s-a) for values that otherwise generate negative values e.g. pinched UV verts, otherwise math domain error
+    return math.sqrt(s * abs(s-a) * abs(s-b) * abs(s-c))
+
+
+
+def get_triangle_areas(obj, buffer, size_x, size_y, matrix=None, faces=None):
+    """World space area and UV area in pixels of every loop triangle of the object, with the face of each triangle.
+    Triangles come from mesh.loop_triangles, so quads and n-gons are measured in full.
+    The matrix replaces the object's world matrix, with faces only the triangles of those faces are measured."""
+    mesh = obj.data
+    loops, triangle_faces = buffer.get_loop_triangles()
+    if faces is not None:
+        keep = np.isin(triangle_faces, faces)
+        loops = loops[keep]
+        triangle_faces = triangle_faces[keep]
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get("co", co)
+    co.shape = (len(mesh.vertices), 3)
+    matrix = np.array(obj.matrix_world if matrix is None else matrix)
+    co = co @ matrix[0:3, 0:3].T + matrix[0:3, 3]
+
+    # Half the length of the cross product
+    tri_vt = co[buffer.loop_vert[loops]]
+    area_vt = np.linalg.norm(np.cross(tri_vt[:, 1] - tri_vt[:, 0], tri_vt[:, 2] - tri_vt[:, 0]), axis=1) / 2
+
+    tri_uv = buffer.uvs[loops].astype(np.float64) * (size_x, size_y)
+    a = tri_uv[:, 1] - tri_uv[:, 0]
+    b = tri_uv[:, 2] - tri_uv[:, 0]
+    area_uv = np.abs(a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]) / 2
+
+    return triangle_faces, area_vt, area_uv
+
+
+
+def get_face_areas(obj, buffer, size_x, size_y, matrix=None, faces=None):
+    # Areas (faces,) in world space and in pixels, summed over the triangles of each face
+    triangle_faces, area_vt, area_uv = get_triangle_areas(obj, buffer, size_x, size_y, matrix, faces)
+    return get_group_areas(area_vt, area_uv, triangle_faces, len(buffer.face_loop_start))
+
+
+
+def get_group_areas(area_vt, area_uv, groups, count):
+    """Sum of the areas per group id, e.g. of faces per island, object or material index"""
+    groups = np.asarray(groups, dtype=np.int64)
+    sums_vt = np.zeros(count)
+    sums_uv = np.zeros(count)
+    if len(groups) == 0:
+        return sums_vt, sums_uv
+
+    # Sorted by group, so each group is one contiguous run for reduceat
+    order = np.argsort(groups, kind='stable')
+    groups = groups[order]
+    starts = np.flatnonzero(np.diff(groups, prepend=-1))
+    sums_vt[groups[starts]] = np.add.reduceat(np.asarray(area_vt)[order], starts)
+    sums_uv[groups[starts]] = np.add.reduceat(np.asarray(area_uv)[order], starts)
+    return sums_vt, sums_uv
+
+
+
+def get_density(area_vt, area_uv):
+    # Pixels per unit of the areas, 0 where there is no area
+    area_vt = np.asarray(area_vt, dtype=np.float64)
+    area_uv = np.asarray(area_uv, dtype=np.float64)
+    valid = (area_vt > 0) & (area_uv > 0)
+    return np.sqrt(np.divide(area_uv, area_vt, out=np.zeros_like(area_vt), where=valid))
+
+
+
+def get_face_materials(obj):
+    mesh = obj.data
+    materials = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", materials)
+    return materials
@@ -1,286 +1,787 @@
-import bpy
-import bmesh
-import operator
-import time
-from mathutils import Vector
-from collections import defaultdict
-from math import pi
-
-from . import settings
-from . import utilities_ui
-
-def selection_store():
-    bm = bmesh.from_edit_mesh(bpy.context.active_object.data);
-    uv_layers = bm.loops.layers.uv.verify();
-
-    # https://blender.stackexchange.com/questions/5781/how-to-list-all-selected-elements-in-python
-    # print("selectionStore")
-    settings.selection_uv_mode = bpy.context.scene.tool_settings.uv_select_mode
-    settings.selection_uv_pivot = bpy.context.tool_settings.transform_pivot_point
-    
-    settings.selection_uv_pivot_pos = bpy.context.space_data.cursor_location.copy()
-
-    #VERT Selection
-    settings.selection_mode = tuple(bpy.context.scene.tool_settings.mesh_select_mode)
-    settings.selection_vert_indexies = []
-    for vert in bm.verts:
-        if vert.select:
-            settings.selection_vert_indexies.append(vert.index)
-
-    settings.selection_face_indexies = []
-    for face in bm.faces:
-        if face.select:
-            settings.selection_face_indexies.append(face.index)
-
-
-    #Face selections (Loops)
-    settings.selection_uv_loops = []
-    for face in bm.faces:
-        for loop in face.loops:
-            if loop[uv_layers].select:
-                settings.selection_uv_loops.append( [face.index, loop.vert.index] )
-
-
-
-def selection_restore(bm = None, uv_layers = None):
-
-    if bpy.context.object.mode != 'EDIT':
-        bpy.ops.object.mode_set(mode = 'EDIT')
-
-    if not bm:
-        bm = bmesh.from_edit_mesh(bpy.context.active_object.data);
-    if not uv_layers:
-        uv_layers = bm.loops.layers.uv.verify();
-
-    # print("selectionRestore")
-    bpy.context.scene.tool_settings.uv_select_mode = settings.selection_uv_mode
-    bpy.context.tool_settings.transform_pivot_point = settings.selection_uv_pivot
-
-    contextViewUV = utilities_ui.GetContextViewUV()
-    if contextViewUV:
-        bpy.ops.uv.cursor_set(contextViewUV, location=settings.selection_uv_pivot_pos)
-
-
-    bpy.ops.mesh.select_all(action='DESELECT')
-
-    if hasattr(bm.verts, "ensure_lookup_table"): 
-        bm.verts.ensure_lookup_table()
-        # bm.edges.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-
-    #FACE selection
-    bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='FACE')
-    for index in settings.selection_face_indexies:
-        if index < len(bm.faces):
-            bm.faces[index].select = True
-
-    #VERT Selection
-    bpy.ops.mesh.select_mode(use_extend=False, use_expand=False, type='VERT')
-    for index in settings.selection_vert_indexies:
-        if index < len(bm.verts):
-            bm.verts[index].select = True
-
-    #Selection Mode
-    bpy.context.scene.tool_settings.mesh_select_mode = settings.selection_mode
-
-
-    #UV Face-UV Selections (Loops)
-    bpy.ops.uv.select_all(contextViewUV, action='DESELECT')
-    for uv_set in settings.selection_uv_loops:
-        for loop in bm.faces[ uv_set[0] ].loops:
-            if loop.vert.index == uv_set[1]:
-                loop[uv_layers].select = True
-                break
-
-    bpy.context.view_layer.update()
-
-
-
-def get_selected_faces():
-    bm = bmesh.from_edit_mesh(bpy.context.active_object.data);
-    faces = [];
-    for face in bm.faces:
-        if face.select:
-            faces.append(face)
-
-    return faces
-
-
-
-def set_selected_faces(faces):
-    bm = bmesh.from_edit_mesh(bpy.context.active_object.data);
-    uv_layers = bm.loops.layers.uv.verify();
-    for face in faces:
-        for loop in face.loops:
-            loop[uv_layers].select = True
-
-
-def get_selected_uvs(bm, uv_layers):
-    """Returns selected mesh vertices of selected UV's"""
-    uvs = []
-    for face in bm.faces:
-        if face.select:
-            for loop in face.loops:
-                if loop[uv_layers].select:
-                    uvs.append( loop[uv_layers] )
-    return uvs
-
-
-
-def get_selected_uv_verts(bm, uv_layers):
-    """Returns selected mesh vertices of selected UV's"""
-    verts = set()
-    for face in bm.faces:
-        if face.select:
-            for loop in face.loops:
-                if loop[uv_layers].select:
-                    verts.add( loop.vert )
-    return list(verts)
-
-
-
-def get_selected_uv_edges(bm, uv_layers):
-    """Returns selected mesh edges of selected UV's"""
-    verts = get_selected_uv_verts(bm, uv_layers)
-    edges = []
-    for edge in bm.edges:
-        if edge.verts[0] in verts and edge.verts[1] in verts:
-            edges.append(edge)
-    return edges
-
-
-
-def get_selected_uv_faces(bm, uv_layers):
-    """Returns selected mesh faces of selected UV's"""
-    faces = []
-    for face in bm.faces:
-        if face.select:
-            count = 0
-            for loop in face.loops:
-                if loop[uv_layers].select:
-                    count+=1
-            if count == len(face.loops):
-                faces.append(face)
-    return faces
-
-
-
-def get_vert_to_uv(bm, uv_layers):
-    vert_to_uv = {}
-    for face in bm.faces:
-        for loop in face.loops:
-            vert = loop.vert
-            uv = loop[uv_layers]
-            if vert not in vert_to_uv:
-                vert_to_uv[vert] = [uv];
-            else:
-                vert_to_uv[vert].append(uv)
-    return vert_to_uv
-
-
-
-def get_uv_to_vert(bm, uv_layers):
-    uv_to_vert = {}
-    for face in bm.faces:
-        for loop in face.loops:
-            vert = loop.vert
-            uv = loop[uv_layers]
-            if uv not in uv_to_vert:
-                uv_to_vert[ uv ] = vert;
-    return uv_to_vert
-
-
-
-
-def getSelectionBBox():
-    bm = bmesh.from_edit_mesh(bpy.context.active_object.data);
-    uv_layers = bm.loops.layers.uv.verify();
-    
-    bbox = {}
-    
-    boundsMin = Vector((99999999.0,99999999.0))
-    boundsMax = Vector((-99999999.0,-99999999.0))
-    boundsCenter = Vector((0.0,0.0))
-    countFaces = 0;
-    
-    for face in bm.faces:
-        if face.select:
-            for loop in face.loops:
-                if loop[uv_layers].select is True:
-                    uv = loop[uv_layers].uv
-                    boundsMin.x = min(boundsMin.x, uv.x)
-                    boundsMin.y = min(boundsMin.y, uv.y)
-                    boundsMax.x = max(boundsMax.x, uv.x)
-                    boundsMax.y = max(boundsMax.y, uv.y)
-            
-                    boundsCenter+= uv
-                    countFaces+=1
-    
-    bbox['min'] = boundsMin
-    bbox['max'] = boundsMax
-    bbox['width'] = (boundsMax - boundsMin).x
-    bbox['height'] = (boundsMax - boundsMin).y
-    
-    if countFaces == 0:
-        bbox['center'] = boundsMin
-    else:
-        bbox['center'] = boundsCenter / countFaces
-
-    bbox['area'] = bbox['width'] * bbox['height']
-    bbox['minLength'] = min(bbox['width'], bbox['height'])
-                
-    return bbox;
-
-
-
-def getSelectionIslands(bm=None, uv_layers=None):
-    if bm == None:
-        bm = bmesh.from_edit_mesh(bpy.context.active_object.data)
-        uv_layers = bm.loops.layers.uv.verify()
-
-    #Reference A: https://github.com/nutti/Magic-UV/issues/41
-    #Reference B: https://github.com/c30ra/uv-align-distribute/blob/v2.2/make_island.py
-
-    #Extend selection
-    if bpy.context.scene.tool_settings.use_uv_select_sync == False:
-        bpy.ops.uv.select_linked()
- 
-    #Collect selected UV faces
-    faces_selected = [];
-    for face in bm.faces:
-        if face.select and face.loops[0][uv_layers].select:
-            faces_selected.append(face)
-        
-    #Collect UV islands
-    # faces_parsed = []
-    faces_unparsed = faces_selected.copy()
-    islands = []
-
-    for face in faces_selected:
-        if face in faces_unparsed:
-
-            #Select single face
-            bpy.ops.uv.select_all(action='DESELECT')
-            face.loops[0][uv_layers].select = True;
-            bpy.ops.uv.select_linked()#Extend selection
-            
-            #Collect faces
-            islandFaces = [face];
-            for faceAll in faces_unparsed:
-                if faceAll != face and faceAll.select and faceAll.loops[0][uv_layers].select:
-                    islandFaces.append(faceAll)
-            
-            for faceAll in islandFaces:
-                faces_unparsed.remove(faceAll)
-
-            #Assign Faces to island
-            islands.append(islandFaces)
-    
-    #Restore selection 
-    # for face in faces_selected:
-    #     for loop in face.loops:
-    #         loop[uv_layers].select = True
-
-    
-    print("Islands: {}x".format(len(islands)))
-    return islands
+import bpy
+import bmesh
+import operator
+import time
+import numpy as np
+from mathutils import Vector
+from collections import defaultdict, deque
+from math import pi, isclose
+
+from . import settings
+from . import utilities_ui
+from . import utilities_island_cache
+from . import utilities_uv_buffer
+from . import utilities_uv_cluster
+from . import utilities_uv_geometry
+
+def selection_store():
+    # Snapshots nest, each restore returns to the most recent store
+    settings.selection_snapshots.append( SelectionSnapshot(bpy.context.active_object) )
+    del settings.selection_snapshots[:-settings.selection_snapshots_max]
+
+
+
+def selection_restore(bm = None, uv_layers = None):
+    if len(settings.selection_snapshots) == 0:
+        return
+
+    snapshot = settings.selection_snapshots.pop()
+
+    if snapshot.obj.mode != 'EDIT':
+        bpy.ops.object.mode_set(mode = 'EDIT')
+
+    snapshot.restore(bm)
+    bpy.context.view_layer.update()
+
+
+
+class SelectionSnapshot:
+    """Vert, edge, face and UV loop selection of a mesh as boolean arrays, with the UV editor state.
+    Stored with foreach_get and restored without operators, in edit mode only changed elements are written."""
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.mesh = obj.data
+
+        # https://blender.stackexchange.com/questions/5781/how-to-list-all-selected-elements-in-python
+        tool_settings = bpy.context.scene.tool_settings
+        self.uv_select_mode = tool_settings.uv_select_mode
+        self.pivot_point = tool_settings.transform_pivot_point
+        self.mesh_select_mode = tuple(tool_settings.mesh_select_mode)
+
+        self.cursor_location = None
+        if bpy.context.space_data and bpy.context.space_data.type == 'IMAGE_EDITOR':
+            self.cursor_location = bpy.context.space_data.cursor_location.copy()
+
+        self.uv_name = self.mesh.uv_layers.active.name if self.mesh.uv_layers else None
+        self.verts, self.edges, self.faces, self.uvs = self.read()
+
+
+    def read(self):
+        if self.obj.mode == 'EDIT':
+            self.obj.update_from_editmode()
+
+        mesh = self.mesh
+        verts = np.empty(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get("select", verts)
+        edges = np.empty(len(mesh.edges), dtype=bool)
+        mesh.edges.foreach_get("select", edges)
+        faces = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.polygons.foreach_get("select", faces)
+
+        uvs = np.empty(len(mesh.loops), dtype=bool)
+        if self.uv_name in mesh.uv_layers:
+            mesh.uv_layers[self.uv_name].data.foreach_get("select", uvs)
+        else:
+            uvs[:] = False
+
+        return verts, edges, faces, uvs
+
+
+    def restore(self, bm=None):
+        tool_settings = bpy.context.scene.tool_settings
+        tool_settings.uv_select_mode = self.uv_select_mode
+        tool_settings.transform_pivot_point = self.pivot_point
+
+        contextViewUV = utilities_ui.GetContextViewUV()
+        if contextViewUV and self.cursor_location:
+            contextViewUV['area'].spaces.active.cursor_location = self.cursor_location
+
+        if self.obj.mode == 'EDIT':
+            self.restore_edit(bm)
+        else:
+            self.restore_object()
+
+        tool_settings.mesh_select_mode = self.mesh_select_mode
+
+
+    def restore_object(self):
+        mesh = self.mesh
+        if len(mesh.vertices) == len(self.verts):
+            mesh.vertices.foreach_set("select", self.verts)
+        if len(mesh.edges) == len(self.edges):
+            mesh.edges.foreach_set("select", self.edges)
+        if len(mesh.polygons) == len(self.faces):
+            mesh.polygons.foreach_set("select", self.faces)
+        if len(mesh.loops) == len(self.uvs) and self.uv_name in mesh.uv_layers:
+            mesh.uv_layers[self.uv_name].data.foreach_set("select", self.uvs)
+        mesh.update()
+
+
+    def restore_edit(self, bm=None):
+        verts, edges, faces, uvs = self.read()
+        mesh = self.mesh
+        if not bm:
+            bm = bmesh.from_edit_mesh(mesh)
+
+        # Elements added since the store are left as they are
+        def get_changed(current, stored):
+            count = min(len(current), len(stored))
+            return np.flatnonzero(current[:count] != stored[:count])
+
+        loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_start)
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_total)
+        loop_vert = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vert)
+        loop_edge = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", loop_edge)
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edge_verts)
+
+        # Face changes flush to their edges and verts and edge changes to their verts,
+        # so those are written again after the faces and edges.
+        faces_changed = get_changed(faces, self.faces)
+        loops = np.repeat(loop_start[faces_changed] - np.cumsum(loop_total[faces_changed]) + loop_total[faces_changed], loop_total[faces_changed])
+        loops = loops + np.arange(len(loops), dtype=np.int32)
+
+        edges_changed = np.union1d(get_changed(edges, self.edges), loop_edge[loops])
+        edges_changed = edges_changed[edges_changed < len(self.edges)]
+
+        verts_changed = np.union1d(get_changed(verts, self.verts), loop_vert[loops])
+        verts_changed = np.union1d(verts_changed, edge_verts.reshape(-1, 2)[edges_changed].ravel())
+        verts_changed = verts_changed[verts_changed < len(self.verts)]
+
+        bm.faces.ensure_lookup_table()
+        bm.edges.ensure_lookup_table()
+        bm.verts.ensure_lookup_table()
+
+        for index in faces_changed.tolist():
+            bm.faces[index].select = bool(self.faces[index])
+        for index in edges_changed.tolist():
+            bm.edges[index].select = bool(self.edges[index])
+        for index in verts_changed.tolist():
+            bm.verts[index].select = bool(self.verts[index])
+
+        # UV Face-UV Selections (Loops)
+        if self.uv_name in bm.loops.layers.uv and len(uvs) == len(self.uvs):
+            uv_layers = bm.loops.layers.uv[self.uv_name]
+            loop_face = np.repeat(np.arange(len(loop_start), dtype=np.int32), loop_total)
+            uvs_changed = get_changed(uvs, self.uvs)
+            for index, face in zip(uvs_changed.tolist(), loop_face[uvs_changed].tolist()):
+                bm.faces[face].loops[index - int(loop_start[face])][uv_layers].select = bool(self.uvs[index])
+
+        bmesh.update_edit_mesh(mesh)
+
+
+
+def get_selected_faces():
+    bm = bmesh.from_edit_mesh(bpy.context.active_object.data);
+    faces = [];
+    for face in bm.faces:
+        if face.select:
+            faces.append(face)
+
+    return faces
+
+
+
+def set_selected_faces(faces):
+    bm = bmesh.from_edit_mesh(bpy.context.active_object.data);
+    uv_layers = bm.loops.layers.uv.verify();
+    for face in faces:
+        for loop in face.loops:
+            loop[uv_layers].select = True
+
+
+def get_selected_uvs(bm, uv_layers):
+    """Returns selected mesh vertices of selected UV's"""
+    uvs = []
+    for face in bm.faces:
+        if face.select:
+            for loop in face.loops:
+                if loop[uv_layers].select:
+                    uvs.append( loop[uv_layers] )
+    return uvs
+
+
+
+def get_selected_uv_verts(bm, uv_layers):
+    """Returns selected mesh vertices of selected UV's"""
+    verts = set()
+    for face in bm.faces:
+        if face.select:
+            for loop in face.loops:
+                if loop[uv_layers].select:
+                    verts.add( loop.vert )
+    return list(verts)
+
+
+
+def get_selected_uv_edges(bm, uv_layers):
+    """Returns selected mesh edges of selected UV's"""
+    verts = get_selected_uv_verts(bm, uv_layers)
+    edges = []
+    for edge in bm.edges:
+        if edge.verts[0] in verts and edge.verts[1] in verts:
+            edges.append(edge)
+    return edges
+
+
+
+def get_selected_uv_faces(bm, uv_layers):
+    """Returns selected mesh faces of selected UV's"""
+    faces = []
+    for face in bm.faces:
+        if face.select:
+            count = 0
+            for loop in face.loops:
+                if loop[uv_layers].select:
+                    count+=1
+            if count == len(face.loops):
+                faces.append(face)
+    return faces
+
+
+
+def get_vert_to_uv(bm, uv_layers):
+    vert_to_uv = {}
+    for face in bm.faces:
+        for loop in face.loops:
+            vert = loop.vert
+            uv = loop[uv_layers]
+            if vert not in vert_to_uv:
+                vert_to_uv[vert] = [uv];
+            else:
+                vert_to_uv[vert].append(uv)
+    return vert_to_uv
+
+
+
+def get_uv_to_vert(bm, uv_layers):
+    uv_to_vert = {}
+    for face in bm.faces:
+        for loop in face.loops:
+            vert = loop.vert
+            uv = loop[uv_layers]
+            if uv not in uv_to_vert:
+                uv_to_vert[ uv ] = vert;
+    return uv_to_vert
+
+
+
+
+def getSelectionBBox(buffer=None):
+    if buffer == None:
+        buffer = utilities_uv_buffer.UVBuffer(bpy.context.active_object)
+    return get_uvs_bbox(buffer.uvs[buffer.get_selected_loops()])
+
+
+
+def get_uvs_bbox(uvs):
+    """Bounds of a (n, 2) array of UV coordinates"""
+    bbox = {}
+
+    if len(uvs) == 0:
+        boundsMin = Vector((99999999.0,99999999.0))
+        boundsMax = Vector((-99999999.0,-99999999.0))
+        boundsCenter = boundsMin
+    else:
+        boundsMin = Vector(uvs.min(axis=0).tolist())
+        boundsMax = Vector(uvs.max(axis=0).tolist())
+        boundsCenter = Vector(uvs.mean(axis=0, dtype=np.float64).tolist())
+
+    bbox['min'] = boundsMin
+    bbox['max'] = boundsMax
+    bbox['width'] = (boundsMax - boundsMin).x
+    bbox['height'] = (boundsMax - boundsMin).y
+    bbox['center'] = boundsCenter
+    bbox['area'] = bbox['width'] * bbox['height']
+    bbox['minLength'] = min(bbox['width'], bbox['height'])
+
+    return bbox
+
+
+
+def get_objects():
+    """Mesh objects with UVs to work on: all objects in multi object edit mode, sharing mesh data only once"""
+    if bpy.context.active_object and bpy.context.active_object.mode == 'EDIT':
+        objects = bpy.context.objects_in_mode_unique_data
+    else:
+        objects = [bpy.context.active_object] if bpy.context.active_object else []
+    return [obj for obj in objects if obj.type == 'MESH' and obj.data.uv_layers]
+
+
+
+def get_buffer(objects=None):
+    """Combined UV buffer of the objects, None when there are no objects with UVs"""
+    if objects == None:
+        objects = get_objects()
+    if len(objects) == 0:
+        return None
+    return utilities_uv_buffer.UVBufferBatch(objects)
+
+
+
+def getSelectionIslandsObjects(objects=None):
+    """Selected islands of all objects, returns the islands and the object index of each island"""
+    if objects == None:
+        objects = get_objects()
+
+    islands = []
+    island_objects = []
+    for i, obj in enumerate(objects):
+        bm = bmesh.from_edit_mesh(obj.data)
+        uv_layers = bm.loops.layers.uv.verify()
+        for island in getSelectionIslands(bm, uv_layers, obj.data):
+            islands.append(island)
+            island_objects.append(i)
+    return islands, island_objects
+
+
+
+def getSelectionIslands(bm=None, uv_layers=None, mesh=None):
+    if mesh == None:
+        mesh = bpy.context.active_object.data
+    if bm == None:
+        bm = bmesh.from_edit_mesh(mesh)
+        uv_layers = bm.loops.layers.uv.verify()
+
+    # Faces shown in the UV editor, in sync mode only the selected mesh faces
+    faces_visible = [face for face in bm.faces if face.select]
+
+    if bpy.context.scene.tool_settings.use_uv_select_sync:
+        faces_selected = set(faces_visible)
+    else:
+        # Islands are picked by any selected UV, same as uv.select_linked
+        faces_selected = set(face for face in faces_visible if any(loop[uv_layers].select for loop in face.loops))
+
+    index = get_island_index(bm, uv_layers, mesh)
+    bm.faces.index_update()
+    bm.faces.ensure_lookup_table()
+
+    # Dict keys keep the order the islands are found in
+    island_ids = {}
+    for face in faces_visible:
+        if face in faces_selected:
+            island_ids[index.face_island[face.index]] = True
+
+    islands = []
+    for island_id in island_ids:
+        faces = [bm.faces[i] for i in index.islands[island_id] if bm.faces[i].select]
+        if len(faces) == len(index.islands[island_id]):
+            islands.append(faces)
+        else:
+            # Partly hidden islands can fall apart into several islands
+            for island in get_islands(faces, uv_layers):
+                if any(face in faces_selected for face in island):
+                    islands.append(island)
+
+    print("Islands: {}x".format(len(islands)))
+    return islands
+
+
+
+def get_island_index(bm=None, uv_layers=None, mesh=None):
+    """Returns the cached face to island map of all faces, rebuilt when the mesh changed"""
+    if mesh == None:
+        mesh = bpy.context.active_object.data
+    if bm == None:
+        bm = bmesh.from_edit_mesh(mesh)
+        uv_layers = bm.loops.layers.uv.verify()
+
+    signature = (len(bm.verts), len(bm.edges), len(bm.faces))
+    index = utilities_island_cache.get(mesh, uv_layers.name, signature)
+    if index == None:
+        bm.faces.index_update()
+        islands = get_islands(bm.faces, uv_layers)
+        index = utilities_island_cache.IslandIndex(signature, [[face.index for face in island] for island in islands])
+        utilities_island_cache.store(mesh, uv_layers.name, index)
+
+    return index
+
+
+
+def get_island_bounds(islands, buffer=None):
+    """Bounds of all islands in one pass over the UV buffer, does not touch the selection.
+    Returns a bbox dict per island with the same layout as getSelectionBBox."""
+    if buffer == None:
+        buffer = utilities_uv_buffer.UVBuffer(bpy.context.active_object)
+
+    mins, maxs, centers = get_island_bounds_arrays(islands, buffer)
+
+    bounds = []
+    for i in range(len(islands)):
+        bbox = {}
+        bbox['min'] = Vector(mins[i].tolist())
+        bbox['max'] = Vector(maxs[i].tolist())
+        bbox['width'] = bbox['max'].x - bbox['min'].x
+        bbox['height'] = bbox['max'].y - bbox['min'].y
+        bbox['center'] = Vector(centers[i].tolist())
+        bbox['area'] = bbox['width'] * bbox['height']
+        bbox['minLength'] = min(bbox['width'], bbox['height'])
+        bounds.append(bbox)
+    return bounds
+
+
+
+def get_island_bounds_arrays(islands, buffer, island_objects=None):
+    """Min, max and center (n, 2) arrays of the islands, using segment reductions over the island loops"""
+    if len(islands) == 0:
+        empty = np.empty((0, 2), dtype=np.float64)
+        return empty, empty.copy(), empty.copy()
+
+    loops, offsets, counts = get_islands_loops(islands, buffer, island_objects)
+    uvs = buffer.uvs[loops].astype(np.float64)
+
+    mins = np.minimum.reduceat(uvs, offsets, axis=0)
+    maxs = np.maximum.reduceat(uvs, offsets, axis=0)
+    centers = np.add.reduceat(uvs, offsets, axis=0) / counts[:, None]
+    return mins, maxs, centers
+
+
+
+def get_islands_faces(islands, buffer, island_objects=None):
+    """Buffer face indices of all islands sorted by island and the face count per island.
+    With a UVBufferBatch island_objects holds the object index of each island."""
+    faces = np.fromiter((face.index for island in islands for face in island), dtype=np.int32)
+    face_counts = np.fromiter((len(island) for island in islands), dtype=np.int32, count=len(islands))
+    if island_objects != None:
+        faces += np.repeat(buffer.face_offsets[island_objects], face_counts)
+    return faces, face_counts
+
+
+
+def get_islands_loops(islands, buffer, island_objects=None):
+    """Loop indices of all islands sorted by island.
+    With a UVBufferBatch island_objects holds the object index of each island.
+    Returns the loops, the offset where each island starts and the loop count per island."""
+    if len(islands) == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty.copy(), empty.copy()
+
+    faces, face_counts = get_islands_faces(islands, buffer, island_objects)
+    face_offsets = np.concatenate(([0], np.cumsum(face_counts)[:-1])).astype(np.int32)
+
+    loops = buffer.get_face_loops(faces)
+    counts = np.add.reduceat(buffer.face_loop_total[faces], face_offsets)
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int32)
+    return loops, offsets, counts
+
+
+
+def get_islands_overlap(islands, buffer, island_objects=None, chunk_size=1 << 20):
+    """Islands whose UV triangles overlap.
+    Candidate island pairs come from sweep and prune over the island bounds, their triangles are then tested against each other.
+    Returns the overlapping island pairs (n, 2) and an overlap flag per buffer face."""
+    face_overlap = np.zeros(len(buffer.face_loop_total), dtype=bool)
+    island_pairs = np.empty((0, 2), dtype=np.int64)
+    if len(islands) < 2:
+        return island_pairs, face_overlap
+
+    # Broad phase: island bounds
+    mins, maxs, _ = get_island_bounds_arrays(islands, buffer, island_objects)
+    candidates = utilities_uv_geometry.get_overlapping_boxes(mins, maxs)
+    if len(candidates) == 0:
+        return island_pairs, face_overlap
+
+    # Triangles of islands that have a candidate
+    faces, face_counts = get_islands_faces(islands, buffer, island_objects)
+    face_island = np.full(len(face_overlap), -1, dtype=np.int64)
+    face_island[faces] = np.repeat(np.arange(len(islands)), face_counts)
+
+    # The extra last entry is indexed by faces outside of the islands (-1)
+    is_candidate = np.zeros(len(islands) + 1, dtype=bool)
+    is_candidate[candidates.ravel()] = True
+
+    triangle_loops, triangle_faces = buffer.get_loop_triangles()
+    triangle_island = face_island[triangle_faces]
+    keep = is_candidate[triangle_island]
+    triangle_faces = triangle_faces[keep]
+    triangle_island = triangle_island[keep]
+    triangles = buffer.uvs[triangle_loops[keep]].astype(np.float64)
+
+    # Triangle bounds of different islands, only for island pairs of the broad phase
+    pairs = utilities_uv_geometry.get_overlapping_boxes(triangles.min(axis=1), triangles.max(axis=1), triangle_island)
+    island_a = triangle_island[pairs[:, 0]]
+    island_b = triangle_island[pairs[:, 1]]
+    keys = np.minimum(island_a, island_b) * len(islands) + np.maximum(island_a, island_b)
+    pairs = pairs[np.isin(keys, candidates[:, 0] * len(islands) + candidates[:, 1])]
+
+    # Narrow phase: triangle intersection in UV space
+    hits = [np.empty((0, 2), dtype=np.int64)]
+    for start in range(0, len(pairs), chunk_size):
+        chunk = pairs[start:start + chunk_size]
+        overlap = utilities_uv_geometry.get_triangles_overlap(triangles[chunk[:, 0]], triangles[chunk[:, 1]])
+        hits.append(chunk[overlap])
+    hits = np.concatenate(hits)
+
+    face_overlap[triangle_faces[hits.ravel()]] = True
+    if len(hits) > 0:
+        island_pairs = np.unique(np.sort(triangle_island[hits], axis=1), axis=0)
+    return island_pairs, face_overlap
+
+
+
+def get_faces_signed_area(buffer):
+    """Signed UV area of every buffer face from its loop triangles, negative where the face is flipped"""
+    triangle_loops, triangle_faces = buffer.get_loop_triangles()
+    triangles = buffer.uvs[triangle_loops].astype(np.float64)
+    edge_1 = triangles[:, 1] - triangles[:, 0]
+    edge_2 = triangles[:, 2] - triangles[:, 0]
+    area = (edge_1[:, 0] * edge_2[:, 1] - edge_1[:, 1] * edge_2[:, 0]) / 2
+    return np.bincount(triangle_faces, weights=area, minlength=len(buffer.face_loop_total))
+
+
+
+def get_islands_flipped(islands, buffer, island_objects=None):
+    """Flipped flag per buffer face and the ratio of flipped faces per island"""
+    face_flipped = get_faces_signed_area(buffer) < 0
+    if len(islands) == 0:
+        return face_flipped, np.empty(0)
+
+    faces, face_counts = get_islands_faces(islands, buffer, island_objects)
+    face_island = np.repeat(np.arange(len(islands)), face_counts)
+    island_ratio = np.bincount(face_island, weights=face_flipped[faces], minlength=len(islands)) / face_counts
+    return face_flipped, island_ratio
+
+
+
+def get_faces_bbox(faces, uv_layers):
+    uvs = [loop[uv_layers].uv for face in faces for loop in face.loops]
+    if len(uvs) == 0:
+        boundsMin = Vector((99999999.0,99999999.0))
+        boundsMax = Vector((-99999999.0,-99999999.0))
+        boundsCenter = boundsMin
+    else:
+        boundsMin = Vector((min(uv.x for uv in uvs), min(uv.y for uv in uvs)))
+        boundsMax = Vector((max(uv.x for uv in uvs), max(uv.y for uv in uvs)))
+        boundsCenter = sum(uvs, Vector((0.0,0.0))) / len(uvs)
+
+    bbox = {}
+    bbox['min'] = boundsMin
+    bbox['max'] = boundsMax
+    bbox['width'] = (boundsMax - boundsMin).x
+    bbox['height'] = (boundsMax - boundsMin).y
+    bbox['center'] = boundsCenter
+    bbox['area'] = bbox['width'] * bbox['height']
+    bbox['minLength'] = min(bbox['width'], bbox['height'])
+    return bbox
+
+
+
+def get_island_hash(faces, bm=None, uv_layers=None, mesh=None, iterations=3):
+    """Canonical fingerprint of an island as (topology hash, mesh area, perimeter), cached per island.
+    The topology hash is a Weisfeiler-Lehman hash of the face adjacency inside the island, the sizes are compared with is_island_similar"""
+    if mesh == None:
+        mesh = bpy.context.active_object.data
+    if bm == None:
+        bm = bmesh.from_edit_mesh(mesh)
+        uv_layers = bm.loops.layers.uv.verify()
+
+    index = get_island_index(bm, uv_layers, mesh)
+    island_id = index.get_island_id(faces)
+    if island_id != None and island_id in index.hashes:
+        return index.hashes[island_id]
+
+    neighbours, edges_border = get_island_adjacency(faces)
+    labels = get_island_labels(faces, neighbours, iterations)
+    perimeter = sum(edge.calc_length() for edge in edges_border)
+
+    area = sum(face.calc_area() for face in faces)
+    value = (
+        hash((len(faces), tuple(sorted(labels.values())))),
+        area,
+        perimeter
+    )
+
+    if island_id != None:
+        index.hashes[island_id] = value
+    return value
+
+
+
+def is_island_similar(hash_a, hash_b, tolerance=0.001):
+    # Same topology with area and perimeter within the relative tolerance, sizes are not rounded so nearly equal islands never fall on two sides of a boundary
+    return hash_a[0] == hash_b[0] and isclose(hash_a[1], hash_b[1], rel_tol=tolerance) and isclose(hash_a[2], hash_b[2], rel_tol=tolerance)
+
+
+
+def get_islands_identical(hashes, tolerance=0.001):
+    """Groups of indices into the island hashes, in order of their first island.
+    Islands are bucketed by topology and swept in order of area, each joins the first open group whose smallest island is similar to it."""
+    buckets = defaultdict(list)
+    for i, value in enumerate(hashes):
+        buckets[value[0]].append(i)
+
+    groups = []
+    for bucket in buckets.values():
+        # Groups leave the window once their smallest island is outside the tolerance of the current area
+        window = deque()
+        for i in sorted(bucket, key=lambda i: hashes[i][1]):
+            while window and not isclose(hashes[window[0][0]][1], hashes[i][1], rel_tol=tolerance):
+                window.popleft()
+            for group in window:
+                if is_island_similar(hashes[group[0]], hashes[i], tolerance):
+                    group.append(i)
+                    break
+            else:
+                window.append([i])
+                groups.append(window[-1])
+
+    for group in groups:
+        group.sort()
+    groups.sort()
+    return groups
+
+
+
+def get_island_adjacency(faces):
+    """Faces linked by edges inside the island and the border edges, used by only one face of the island"""
+    edge_faces = defaultdict(list)
+    for face in faces:
+        for edge in face.edges:
+            edge_faces[edge].append(face)
+
+    neighbours = defaultdict(list)
+    edges_border = []
+    for edge, linked in edge_faces.items():
+        if len(linked) == 1:
+            edges_border.append(edge)
+        else:
+            for face in linked:
+                neighbours[face].extend(other for other in linked if other != face)
+    return neighbours, edges_border
+
+
+
+def get_island_labels(faces, neighbours, iterations=3):
+    """Weisfeiler-Lehman face labels: start with the corner count and refine by the labels of the neighbours"""
+    labels = {face: len(face.loops) for face in faces}
+    for i in range(iterations):
+        labels = {face: hash((labels[face], tuple(sorted(labels[other] for other in neighbours[face])))) for face in faces}
+    return labels
+
+
+
+def get_edge_loop_next(edge, vert):
+    # Next edge of the edge loop through the vert: straight across a vert with four edges or along the boundary, None where the loop ends
+    if edge.is_boundary:
+        others = [e for e in vert.link_edges if e != edge and e.is_boundary]
+        return others[0] if len(others) == 1 else None
+
+    if len(vert.link_edges) != 4 or not edge.is_manifold:
+        return None
+    faces = set(edge.link_faces)
+    others = [e for e in vert.link_edges if e != edge and faces.isdisjoint(e.link_faces)]
+    return others[0] if len(others) == 1 else None
+
+
+
+def get_island_correspondence(loop_a, loop_b, faces_a, faces_b, reverse=False, strict=True):
+    """Pairs the loops of two islands with the same topology by walking both from a starting loop each.
+    With reverse the second island is walked in opposite winding. Returns a list of (loop a, loop b) or None if they differ.
+    Without strict, faces that do not match are skipped and the pairs found so far are returned."""
+    faces_a = set(faces_a)
+    faces_b = set(faces_b)
+
+    vert_map = {}
+    face_map = {loop_a.face: loop_b.face}
+    pairs = []
+    queue = deque([(loop_a, loop_b, reverse)])
+    while queue:
+        start_a, start_b, is_reverse = queue.popleft()
+        count = len(start_a.face.loops)
+        if count != len(start_b.face.loops):
+            if strict:
+                return None
+            continue
+
+        # Loops of both faces in step
+        face_loops = []
+        a, b = start_a, start_b
+        for i in range(count):
+            face_loops.append((a, b))
+            a = a.link_loop_next
+            b = b.link_loop_prev if is_reverse else b.link_loop_next
+        if any(vert_map.get(a.vert, b.vert) != b.vert for a, b in face_loops):
+            if strict:
+                return None
+            continue
+        for a, b in face_loops:
+            vert_map[a.vert] = b.vert
+        pairs.extend(face_loops)
+
+        # Step over the edges into the neighbour faces
+        for a, b in face_loops:
+            edge_b = b.link_loop_prev if is_reverse else b
+            radial_a = a.link_loop_radial_next
+            if radial_a == a or radial_a.face not in faces_a:
+                continue
+            radial_b = edge_b.link_loop_radial_next
+            if radial_b == edge_b or radial_b.face not in faces_b:
+                if strict:
+                    return None
+                continue
+
+            if radial_a.face in face_map:
+                if face_map[radial_a.face] != radial_b.face and strict:
+                    return None
+                continue
+            face_map[radial_a.face] = radial_b.face
+
+            # Start both neighbours at matching verts, the winding follows from the next vert
+            if radial_b.vert != vert_map[radial_a.vert]:
+                radial_b = radial_b.link_loop_next
+            if radial_b.vert != vert_map[radial_a.vert]:
+                if strict:
+                    return None
+                continue
+            next_b = vert_map[radial_a.link_loop_next.vert]
+            queue.append((radial_a, radial_b, radial_b.link_loop_next.vert != next_b))
+
+    if strict and (len(face_map) != len(faces_a) or len(faces_a) != len(faces_b)):
+        return None
+    return pairs
+
+
+
+def get_islands(faces, uv_layers):
+    """Group faces into UV islands without using operators or changing the selection.
+    Faces are linked when they share a mesh edge that has the same UVs on both sides."""
+    parent = list(range(len(faces)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Each edge side is hashed by its verts and quantized UV coordinates
+    edge_to_face = {}
+    for i, face in enumerate(faces):
+        for loop in face.loops:
+            key = frozenset((get_uv_key(loop, uv_layers), get_uv_key(loop.link_loop_next, uv_layers)))
+            j = edge_to_face.setdefault(key, i)
+            if j != i:
+                root_i = find(i)
+                root_j = find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    # Keep islands and their faces in input order
+    islands = []
+    root_to_island = {}
+    for i, face in enumerate(faces):
+        root = find(i)
+        if root not in root_to_island:
+            root_to_island[root] = len(islands)
+            islands.append([])
+        islands[ root_to_island[root] ].append(face)
+
+    return islands
+
+
+
+def get_uv_key(loop, uv_layers, precision=5):
+    uv = loop[uv_layers].uv
+    return (loop.vert, round(uv.x, precision), round(uv.y, precision))
+
+
+
+def get_buffer_islands(buffer, precision=5):
+    """UV island id of every face in the buffer, from the mesh arrays alone so it works in object mode without a BMesh.
+    Like get_islands, faces are linked when they share a mesh edge that has the same UVs on both sides."""
+    return utilities_uv_cluster.get_face_islands(
+        buffer.uvs, buffer.loop_vert, buffer.loop_face, buffer.face_loop_start, buffer.face_loop_total, precision)
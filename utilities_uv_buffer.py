@@ -0,0 +1,199 @@
+import bpy
+import bmesh
+import numpy as np
+
+
+class UVBuffer:
+    """UV coordinates and selection of a mesh UV layer as contiguous arrays.
+    Reads use foreach_get on the mesh data, in edit mode the edit mesh is synced first.
+    Writes use foreach_set in object mode, in edit mode only the changed loops are copied to the BMesh."""
+
+    def __init__(self, obj, uv_name=None):
+        self.obj = obj
+        self.mesh = obj.data
+        self.is_edit = obj.mode == 'EDIT'
+
+        if self.is_edit:
+            obj.update_from_editmode()
+
+        mesh = self.mesh
+        if uv_name:
+            uv_layer = mesh.uv_layers[uv_name]
+        else:
+            uv_layer = mesh.uv_layers.active
+        self.uv_name = uv_layer.name
+
+        count_loops = len(mesh.loops)
+        count_faces = len(mesh.polygons)
+
+        # Per loop
+        self.uvs = np.empty(count_loops * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", self.uvs)
+        self.uvs.shape = (count_loops, 2)
+        self.uvs_initial = self.uvs.copy()
+
+        self.select = np.empty(count_loops, dtype=bool)
+        uv_layer.data.foreach_get("select", self.select)
+        self.select_initial = self.select.copy()
+
+        self.loop_vert = np.empty(count_loops, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", self.loop_vert)
+
+        self.loop_edge = np.empty(count_loops, dtype=np.int32)
+        mesh.loops.foreach_get("edge_index", self.loop_edge)
+
+        # Per face
+        self.face_loop_start = np.empty(count_faces, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", self.face_loop_start)
+
+        self.face_loop_total = np.empty(count_faces, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", self.face_loop_total)
+
+        self.face_select = np.empty(count_faces, dtype=bool)
+        mesh.polygons.foreach_get("select", self.face_select)
+
+        self.face_hide = np.empty(count_faces, dtype=bool)
+        mesh.polygons.foreach_get("hide", self.face_hide)
+
+        self.loop_face = np.repeat(np.arange(count_faces, dtype=np.int32), self.face_loop_total)
+
+
+    def __len__(self):
+        return len(self.uvs)
+
+
+    def get_face_loops(self, faces):
+        # Loop indices of the given face indices, in face order
+        faces = np.asarray(faces, dtype=np.int32)
+        totals = self.face_loop_total[faces]
+        if len(faces) == 0 or totals.sum() == 0:
+            return np.empty(0, dtype=np.int32)
+        offsets = np.repeat(self.face_loop_start[faces] - np.cumsum(totals) + totals, totals)
+        return (offsets + np.arange(totals.sum(), dtype=np.int32)).astype(np.int32)
+
+
+    def get_selected_loops(self):
+        # Selected UVs of faces shown in the UV editor
+        return np.flatnonzero(self.select & self.face_select[self.loop_face])
+
+
+    def get_loop_triangles(self):
+        # Loop indices (n, 3) and face index of the triangulated faces
+        mesh = self.mesh
+        mesh.calc_loop_triangles()
+        count = len(mesh.loop_triangles)
+
+        loops = np.empty(count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("loops", loops)
+        faces = np.empty(count, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("polygon_index", faces)
+        return loops.reshape(count, 3), faces
+
+
+    def write(self):
+        self.write_uvs()
+        self.write_select()
+
+
+    def write_uvs(self):
+        if self.is_edit:
+            changed = np.flatnonzero((self.uvs != self.uvs_initial).any(axis=1))
+            if len(changed) == 0:
+                return
+            bm = bmesh.from_edit_mesh(self.mesh)
+            uv_layer = bm.loops.layers.uv[self.uv_name]
+            bm.faces.ensure_lookup_table()
+            corners = changed - self.face_loop_start[self.loop_face[changed]]
+            for index, face, corner in zip(changed.tolist(), self.loop_face[changed].tolist(), corners.tolist()):
+                bm.faces[face].loops[corner][uv_layer].uv = self.uvs[index]
+            bmesh.update_edit_mesh(self.mesh)
+        else:
+            self.mesh.uv_layers[self.uv_name].data.foreach_set("uv", self.uvs.ravel())
+            self.mesh.update()
+
+        self.uvs_initial = self.uvs.copy()
+
+
+    def write_select(self):
+        if self.is_edit:
+            changed = np.flatnonzero(self.select != self.select_initial)
+            if len(changed) == 0:
+                return
+            bm = bmesh.from_edit_mesh(self.mesh)
+            uv_layer = bm.loops.layers.uv[self.uv_name]
+            bm.faces.ensure_lookup_table()
+            corners = changed - self.face_loop_start[self.loop_face[changed]]
+            for index, face, corner in zip(changed.tolist(), self.loop_face[changed].tolist(), corners.tolist()):
+                bm.faces[face].loops[corner][uv_layer].select = bool(self.select[index])
+            bmesh.update_edit_mesh(self.mesh)
+        else:
+            self.mesh.uv_layers[self.uv_name].data.foreach_set("select", self.select)
+
+        self.select_initial = self.select.copy()
+
+
+
+class UVBufferBatch(UVBuffer):
+    """UV buffers of one or more objects joined into one set of arrays, e.g. all objects in multi object edit mode.
+    Loop, face, edge and vert indices run over all objects in order, writes are split back per object."""
+
+    def __init__(self, objects, uv_name=None):
+        if len(objects) == 0:
+            raise ValueError("UVBufferBatch requires at least one object")
+        self.buffers = [UVBuffer(obj, uv_name) for obj in objects]
+        self.objects = list(objects)
+        self.is_edit = any(buffer.is_edit for buffer in self.buffers)
+
+        def get_offsets(counts):
+            counts = np.array(counts, dtype=np.int32)
+            return np.cumsum(counts, dtype=np.int32) - counts
+
+        self.loop_offsets = get_offsets([len(buffer.uvs) for buffer in self.buffers])
+        self.face_offsets = get_offsets([len(buffer.face_loop_start) for buffer in self.buffers])
+        self.edge_offsets = get_offsets([len(buffer.mesh.edges) for buffer in self.buffers])
+        self.vert_offsets = get_offsets([len(buffer.mesh.vertices) for buffer in self.buffers])
+
+        def join(name, offsets=None):
+            arrays = [getattr(buffer, name) for buffer in self.buffers]
+            if offsets is not None:
+                arrays = [array + offset for array, offset in zip(arrays, offsets)]
+            return np.concatenate(arrays)
+
+        self.uvs = join('uvs')
+        self.uvs_initial = self.uvs.copy()
+        self.select = join('select')
+        self.select_initial = self.select.copy()
+        self.loop_vert = join('loop_vert', self.vert_offsets)
+        self.loop_edge = join('loop_edge', self.edge_offsets)
+        self.loop_face = join('loop_face', self.face_offsets)
+        self.face_loop_start = join('face_loop_start', self.loop_offsets)
+        self.face_loop_total = join('face_loop_total')
+        self.face_select = join('face_select')
+        self.face_hide = join('face_hide')
+
+
+    def get_range(self, index):
+        # Loop slice of one object
+        start = self.loop_offsets[index]
+        return slice(start, start + len(self.buffers[index].uvs))
+
+
+    def get_loop_triangles(self):
+        triangles = [buffer.get_loop_triangles() for buffer in self.buffers]
+        loops = np.concatenate([loops + offset for (loops, faces), offset in zip(triangles, self.loop_offsets)])
+        faces = np.concatenate([faces + offset for (loops, faces), offset in zip(triangles, self.face_offsets)])
+        return loops, faces
+
+
+    def write_uvs(self):
+        for index, buffer in enumerate(self.buffers):
+            buffer.uvs[:] = self.uvs[self.get_range(index)]
+            buffer.write_uvs()
+        self.uvs_initial = self.uvs.copy()
+
+
+    def write_select(self):
+        for index, buffer in enumerate(self.buffers):
+            buffer.select[:] = self.select[self.get_range(index)]
+            buffer.write_select()
+        self.select_initial = self.select.copy()
@@ -0,0 +1,173 @@
+import numpy as np
+
+
+# Clustering of coincident UV coordinates with a spatial hash grid.
+# Points are bucketed into cells the size of the tolerance, so only the neighbor cells need to be compared.
+
+
+
+def get_clusters(points, tolerance=0.0000001):
+    """Cluster ids (n,) for points (n, 2), points within the tolerance of each other share an id.
+    Ids are numbered in order of the first point of each cluster."""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    count = len(points)
+    if count == 0:
+        return np.empty(0, dtype=np.int64)
+
+    if tolerance <= 0:
+        # Only exactly matching coordinates
+        return get_labels_ordered(np.unique(points, axis=0, return_inverse=True)[1].reshape(-1))
+
+    # Hash grid cells, sorted so each cell is a contiguous range
+    cells = np.floor((points - points.min(axis=0)) / tolerance).astype(np.int64)
+    rows = int(cells[:, 1].max()) + 3
+    keys = (cells[:, 0] + 1) * rows + cells[:, 1] + 1
+    order = np.argsort(keys, kind='stable')
+    keys_sorted = keys[order]
+    cell_keys, cell_starts, cell_counts = np.unique(keys_sorted, return_index=True, return_counts=True)
+
+    # Compare against the own cell and the neighbor cells on one side, every cell pair is visited once
+    pairs_a = []
+    pairs_b = []
+    for offset in (0, rows - 1, rows, rows + 1, 1):
+        neighbor = np.searchsorted(cell_keys, keys_sorted + offset)
+        neighbor = np.minimum(neighbor, len(cell_keys) - 1)
+        found = cell_keys[neighbor] == keys_sorted + offset
+        a = np.flatnonzero(found)
+        if len(a) == 0:
+            continue
+        counts = cell_counts[neighbor[a]]
+        b = np.repeat(cell_starts[neighbor[a]] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        a = np.repeat(a, counts)
+        if offset == 0:
+            keep = a < b
+            a = a[keep]
+            b = b[keep]
+
+        # Exact distance test on the candidates
+        a = order[a]
+        b = order[b]
+        keep = np.einsum('ij,ij->i', points[a] - points[b], points[a] - points[b]) <= tolerance * tolerance
+        pairs_a.append(a[keep])
+        pairs_b.append(b[keep])
+
+    if len(pairs_a) == 0:
+        return np.arange(count)
+    return get_labels_ordered(get_components(count, np.concatenate(pairs_a), np.concatenate(pairs_b)))
+
+
+
+def get_components(count, pairs_a, pairs_b):
+    """Connected components of count elements linked by the index pairs, each element is labeled with the lowest index it is linked to.
+    Disjoint set forest built in rounds: every root hooks onto its linked root of lowest random priority, then all paths are compressed.
+    The roots that stay are local minima of the priorities, so their count halves each round on average."""
+    parent = np.arange(count)
+    pairs_a = np.asarray(pairs_a, dtype=np.int64)
+    pairs_b = np.asarray(pairs_b, dtype=np.int64)
+    random = np.random.RandomState(0)
+
+    while len(pairs_a) > 0:
+        # Links between roots, links within one tree are done
+        pairs_a = parent[pairs_a]
+        pairs_b = parent[pairs_b]
+        keep = pairs_a != pairs_b
+        pairs_a = pairs_a[keep]
+        pairs_b = pairs_b[keep]
+        if len(pairs_a) == 0:
+            break
+
+        # Lowest priority among the linked roots of every root, priorities strictly drop along the hooks so no cycles form
+        priority = random.permutation(count)
+        roots = np.concatenate((pairs_a, pairs_b))
+        linked = priority[np.concatenate((pairs_b, pairs_a))]
+        order = np.argsort(roots * count + linked)
+        roots = roots[order]
+        is_first = np.ones(len(roots), dtype=bool)
+        is_first[1:] = roots[1:] != roots[:-1]
+        roots = roots[is_first]
+        linked = linked[order][is_first]
+
+        hook = linked < priority[roots]
+        element = np.empty(count, dtype=np.int64)
+        element[priority] = np.arange(count)
+        parent[roots[hook]] = element[linked[hook]]
+
+        # Path compression by pointer jumping
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # The first element of every tree is its lowest index
+    first, inverse = np.unique(parent, return_index=True, return_inverse=True)[1:]
+    return first[inverse.reshape(-1)]
+
+
+
+def get_labels_ordered(labels):
+    # Renumber labels 0..m in order of their first occurrence
+    unique, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(unique), dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(len(unique))
+    return rank[inverse.reshape(-1)]
+
+
+
+def get_cluster_first(ids):
+    """Index of the first point of every cluster, in cluster id order."""
+    ids = np.asarray(ids)
+    first = np.full(ids.max() + 1 if len(ids) > 0 else 0, len(ids), dtype=np.int64)
+    np.minimum.at(first, ids, np.arange(len(ids)))
+    return first
+
+
+
+def get_face_islands(uvs, loop_vert, loop_face, face_loop_start, face_loop_total, precision=5):
+    """Island id of every face from the loop arrays of a mesh, faces are linked when they share a mesh edge with the same UVs on both sides.
+    UVs are compared after rounding to the precision in decimals. Ids are numbered in order of the first face of each island."""
+    count_loops = len(uvs)
+    count_faces = len(face_loop_start)
+    if count_loops == 0:
+        return np.arange(count_faces)
+
+    # Next loop in each face
+    loop_next = np.arange(1, count_loops + 1)
+    loop_next[face_loop_start + face_loop_total - 1] = face_loop_start
+
+    # Each edge side is keyed by its verts and quantized UV coordinates, lower vert first
+    uvs = np.round(np.asarray(uvs, dtype=np.float64) * 10**precision).astype(np.int64)
+    vert_a = loop_vert
+    vert_b = loop_vert[loop_next]
+    swap = (vert_a > vert_b)[:, None]
+    uv_keys = np.column_stack((np.where(swap, uvs[loop_next], uvs), np.where(swap, uvs, uvs[loop_next])))
+
+    # Loops of the same mesh edge side by side, a single integer sort
+    edges = np.minimum(vert_a, vert_b).astype(np.int64) * (int(loop_vert.max()) + 1) + np.maximum(vert_a, vert_b)
+    order = np.argsort(edges, kind='stable')
+    edges = edges[order]
+    group = np.concatenate(([0], np.cumsum(edges[1:] != edges[:-1])))
+    group_size = np.bincount(group)[group]
+
+    # Edges between two faces link them when the UVs on both sides match
+    is_pair = (group_size == 2)[:-1] & (group[1:] == group[:-1])
+    loops_a = order[:-1][is_pair]
+    loops_b = order[1:][is_pair]
+    is_same = np.all(uv_keys[loops_a] == uv_keys[loops_b], axis=1)
+    faces_a = [loop_face[loops_a[is_same]]]
+    faces_b = [loop_face[loops_b[is_same]]]
+
+    # Non manifold edges are rare, their loops are matched by the full key
+    loops = order[group_size > 2]
+    if len(loops) > 0:
+        keys = np.column_stack((edges[group_size > 2], uv_keys[loops]))
+        inverse = np.unique(keys, axis=0, return_inverse=True)[1].reshape(-1)
+        order = np.argsort(inverse, kind='stable')
+        is_same = inverse[order][1:] == inverse[order][:-1]
+        faces_a.append(loop_face[loops[order[:-1][is_same]]])
+        faces_b.append(loop_face[loops[order[1:][is_same]]])
+
+    faces_a = np.concatenate(faces_a)
+    faces_b = np.concatenate(faces_b)
+
+    return get_labels_ordered(get_components(count_faces, faces_a, faces_b))
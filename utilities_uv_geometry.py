@@ -0,0 +1,231 @@
+import math
+import numpy as np
+
+
+# 2D geometry on UV arrays: convex hulls and minimal bounding rectangles
+
+
+
+def get_convex_hull(points):
+    # Andrew's monotone chain, counter clockwise without repeating the first point
+    points = np.unique(np.asarray(points, dtype=np.float64).reshape(-1, 2), axis=0)
+    if len(points) < 3:
+        return points
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def build(sequence):
+        hull = []
+        for p in sequence:
+            while len(hull) >= 2 and cross(hull[-2], hull[-1], p) <= 0:
+                hull.pop()
+            hull.append(p)
+        return hull
+
+    sequence = points.tolist()
+    lower = build(sequence)
+    upper = build(reversed(sequence))
+    return np.array(lower[:-1] + upper[:-1], dtype=np.float64)
+
+
+
+def get_convex_hulls(uvs, offsets, counts):
+    # Hull per island of uvs grouped by offsets and counts, returns concatenated points with offsets and counts
+    hulls = [get_convex_hull(uvs[offset:offset + count]) for offset, count in zip(offsets, counts)]
+    hull_counts = np.array([len(hull) for hull in hulls], dtype=np.int64)
+    hull_offsets = np.cumsum(hull_counts) - hull_counts
+    if hull_counts.sum() == 0:
+        return np.empty((0, 2), dtype=np.float64), hull_offsets, hull_counts
+    return np.concatenate(hulls), hull_offsets, hull_counts
+
+
+
+def get_minimal_bounds(hulls, offsets, counts, method='AREA'):
+    # Rotating calipers over all hulls at once: the minimal rectangle has one side on a hull edge.
+    # Returns per hull the angle that makes the rectangle axis aligned (wider than high) and its size.
+    count_hulls = len(counts)
+    angles = np.zeros(count_hulls)
+    sizes = np.zeros((count_hulls, 2))
+
+    valid = np.flatnonzero(counts > 0)
+    if len(valid) == 0:
+        return angles, sizes
+    hull_of_point = np.repeat(np.arange(count_hulls), counts)
+
+    # Edge directions, each hull point to the next one of its hull
+    index = np.arange(len(hulls))
+    local = index - offsets[hull_of_point]
+    index_next = offsets[hull_of_point] + (local + 1) % counts[hull_of_point]
+    directions = hulls[index_next] - hulls
+    lengths = np.linalg.norm(directions, axis=1)
+    directions[lengths == 0] = (1.0, 0.0)
+    lengths[lengths == 0] = 1.0
+    directions /= lengths[:, None]
+    normals = np.stack((-directions[:, 1], directions[:, 0]), axis=1)
+
+    # Counter clockwise edges turn less than a full circle, so their angle from the first edge of the hull only grows
+    edge_angles = np.arctan2(directions[:, 1], directions[:, 0])
+    edge_angles = np.mod(edge_angles - edge_angles[offsets[hull_of_point]], 2 * math.pi)
+
+    # The calipers: a point is the support in a direction up to the first edge that turns more than a quarter from it.
+    # Edges are listed twice per hull for the wrap around and found for all edges at once with one sorted search.
+    stride = 6 * math.pi
+    keys = np.concatenate((edge_angles, edge_angles + 2 * math.pi)) + np.concatenate((hull_of_point, hull_of_point)) * stride
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    order = np.concatenate((index, index))[order]
+
+    def get_support(turn):
+        found = np.searchsorted(keys, edge_angles + hull_of_point * stride + turn)
+        return order[found]
+
+    u_max = np.einsum('ij,ij->i', hulls[get_support(math.pi / 2)], directions)
+    u_min = np.einsum('ij,ij->i', hulls[get_support(math.pi * 3 / 2)], directions)
+    v_max = np.einsum('ij,ij->i', hulls[get_support(math.pi)], normals)
+    v_min = np.einsum('ij,ij->i', hulls, normals)
+    width = u_max - u_min
+    height = v_max - v_min
+
+    if method == 'WIDTH':
+        cost = np.minimum(width, height)
+    else:
+        cost = width * height
+
+    # Best edge per hull, edges are stored contiguous per hull
+    order = np.lexsort((cost, hull_of_point))
+    best = order[offsets[valid]]
+
+    for i, edge in zip(valid.tolist(), best.tolist()):
+        # Smallest rotation that turns the edge onto an axis
+        angle = -math.atan2(directions[edge][1], directions[edge][0])
+        turns = round(angle / (math.pi / 2))
+        angle -= turns * (math.pi / 2)
+        w, h = width[edge], height[edge]
+        if turns % 2 == 1:
+            w, h = h, w
+        if w < h:
+            angle += math.pi / 2
+            w, h = h, w
+        angles[i] = angle
+        sizes[i] = (w, h)
+
+    return angles, sizes
+
+
+
+def get_rotation_minimal_bounds(uvs, aspect=1.0, method='AREA'):
+    # Angle that rotates the UVs to their minimal bounds, measured in pixel space
+    uvs = np.asarray(uvs, dtype=np.float64).reshape(-1, 2) * (aspect, 1.0)
+    hull = get_convex_hull(uvs)
+    angles, sizes = get_minimal_bounds(hull, np.array([0]), np.array([len(hull)]), method)
+    return angles[0]
+
+
+
+def get_islands_rotation_minimal_bounds(uvs, offsets, counts, aspect=1.0, method='AREA'):
+    # Angle per island of uvs grouped by offsets and counts
+    uvs = np.asarray(uvs, dtype=np.float64) * (aspect, 1.0)
+    hulls, hull_offsets, hull_counts = get_convex_hulls(uvs, offsets, counts)
+    angles, sizes = get_minimal_bounds(hulls, hull_offsets, hull_counts, method)
+    return angles
+
+
+
+def get_overlapping_boxes(mins, maxs, groups=None, chunk_size=1 << 21):
+    # Index pairs (i, j) with i < j of boxes that overlap or touch, by sweep and prune along the wider axis.
+    # With groups only pairs of boxes in different groups are returned.
+    count = len(mins)
+    if count < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    centers = (mins + maxs) / 2
+    axis = int(np.argmax(np.ptp(centers, axis=0)))
+    other = 1 - axis
+
+    # Sorted by the start on the sweep axis, each box pairs with the following boxes that start before it ends
+    order = np.argsort(mins[:, axis], kind='stable')
+    sorted_mins = mins[order]
+    sorted_maxs = maxs[order]
+    ends = np.searchsorted(sorted_mins[:, axis], sorted_maxs[:, axis], side='right')
+    counts = np.maximum(ends - np.arange(count) - 1, 0)
+    counts_total = np.cumsum(counts)
+
+    pairs = []
+    start = 0
+    while start < count:
+        # Limit the candidate pairs per step to keep memory bound
+        done = counts_total[start - 1] if start > 0 else 0
+        stop = min(max(int(np.searchsorted(counts_total, done + chunk_size, side='right')), start + 1), count)
+        step_counts = counts[start:stop]
+        step_start = start
+        start = stop
+        if step_counts.sum() == 0:
+            continue
+
+        first = np.repeat(np.arange(step_start, stop), step_counts)
+        second = first + 1 + np.arange(step_counts.sum()) - np.repeat(np.cumsum(step_counts) - step_counts, step_counts)
+
+        keep = (sorted_mins[second, other] <= sorted_maxs[first, other]) & (sorted_mins[first, other] <= sorted_maxs[second, other])
+        first = order[first[keep]]
+        second = order[second[keep]]
+        if groups is not None:
+            keep = groups[first] != groups[second]
+            first = first[keep]
+            second = second[keep]
+        pairs.append(np.stack((np.minimum(first, second), np.maximum(first, second)), axis=1))
+
+    if len(pairs) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(pairs).astype(np.int64)
+
+
+
+def get_triangles_overlap(a, b, epsilon=1e-6):
+    # Tells per pair of triangles (n, 3, 2) if their interiors overlap, by the separating axes of all six edges.
+    # Triangles that only share an edge or corner or have no area do not overlap.
+    overlap = np.ones(len(a), dtype=bool)
+    for triangles in (a, b):
+        for i in range(3):
+            edge = triangles[:, (i + 1) % 3] - triangles[:, i]
+            axis = np.stack((-edge[:, 1], edge[:, 0]), axis=1)
+            length = np.linalg.norm(axis, axis=1)
+            axis /= np.where(length > 0, length, 1.0)[:, None]
+
+            project_a = np.einsum('nij,nj->ni', a, axis)
+            project_b = np.einsum('nij,nj->ni', b, axis)
+            gap = np.minimum(project_a.max(axis=1), project_b.max(axis=1)) - np.maximum(project_a.min(axis=1), project_b.min(axis=1))
+            overlap &= gap > epsilon
+    return overlap
+
+
+
+def get_rigid_fit(source, target, reflection=False):
+    # Procrustes fit of point sets (m, n, 2) onto target (n, 2) or (m, n, 2), solved for all sets at once.
+    # Returns 3x3 matrices (m, 3, 3) with rotation, optional reflection and translation, and the squared error per set.
+    source = np.asarray(source, dtype=np.float64)
+    target = np.broadcast_to(np.asarray(target, dtype=np.float64), source.shape)
+
+    source_center = source.mean(axis=1)
+    target_center = target.mean(axis=1)
+    source_local = source - source_center[:, None]
+    target_local = target - target_center[:, None]
+
+    # Rotation from the SVD of the cross covariance
+    covariance = np.einsum('mni,mnj->mij', source_local, target_local)
+    u, _, vt = np.linalg.svd(covariance)
+    v = np.transpose(vt, (0, 2, 1))
+    ut = np.transpose(u, (0, 2, 1))
+    if not reflection:
+        # Flip the weakest axis where the best orthogonal fit is a reflection
+        sign = np.sign(np.linalg.det(v @ ut))
+        sign[sign == 0] = 1
+        v[:, :, 1] *= sign[:, None]
+    rotation = v @ ut
+
+    matrices = np.tile(np.identity(3), (len(source), 1, 1))
+    matrices[:, 0:2, 0:2] = rotation
+    matrices[:, 0:2, 2] = target_center - np.einsum('mij,mj->mi', rotation, source_center)
+
+    residual = np.einsum('mij,mnj->mni', rotation, source_local) - target_local
+    return matrices, (residual ** 2).sum(axis=(1, 2))
@@ -0,0 +1,93 @@
+import numpy as np
+
+
+# Scanline rasterization of UV triangles into texel grids.
+# Texel centers are sampled with half open spans so triangles sharing an edge never cover a texel twice.
+
+
+
+def get_triangle_spans(triangles, width, height, chunk_size=1 << 22):
+    """Horizontal texel spans of triangles (n, 3, 2) given in texel coordinates.
+    Returns the triangle, row, first column and end column (exclusive) of every non empty span."""
+    triangles = np.asarray(triangles, dtype=np.float64)
+    empty = np.empty(0, dtype=np.int64)
+    if len(triangles) == 0:
+        return empty, empty, empty, empty
+
+    # Rows whose texel center is inside [min y, max y) of the triangle
+    row_first = np.clip(np.ceil(triangles[:, :, 1].min(axis=1) - 0.5), 0, height).astype(np.int64)
+    row_end = np.clip(np.ceil(triangles[:, :, 1].max(axis=1) - 0.5), 0, height).astype(np.int64)
+    row_counts = np.maximum(row_end - row_first, 0)
+
+    # Edges sorted bottom to top, so shared edges give the same x in both triangles
+    edges = []
+    for i in range(3):
+        a = triangles[:, i]
+        b = triangles[:, (i + 1) % 3]
+        swap = (a[:, 1] > b[:, 1]) | ((a[:, 1] == b[:, 1]) & (a[:, 0] > b[:, 0]))
+        edges.append((np.where(swap[:, None], b, a), np.where(swap[:, None], a, b)))
+
+    spans = ([], [], [], [])
+    row_counts_total = np.cumsum(row_counts)
+    start = 0
+    while start < len(triangles):
+        # Limit the rows per step to keep memory bound
+        done = row_counts_total[start - 1] if start > 0 else 0
+        stop = min(max(int(np.searchsorted(row_counts_total, done + chunk_size, side='right')), start + 1), len(triangles))
+        step_counts = row_counts[start:stop]
+        step_start = start
+        start = stop
+        if step_counts.sum() == 0:
+            continue
+
+        triangle = np.repeat(np.arange(step_start, stop), step_counts)
+        row = row_first[triangle] + np.arange(step_counts.sum()) - np.repeat(np.cumsum(step_counts) - step_counts, step_counts)
+        y = row + 0.5
+
+        # Two edges cross each sampled row
+        x_min = np.full(len(row), np.inf)
+        x_max = np.full(len(row), -np.inf)
+        for a, b in edges:
+            a = a[triangle]
+            b = b[triangle]
+            active = (a[:, 1] <= y) & (y < b[:, 1])
+            height_edge = np.where(active, b[:, 1] - a[:, 1], 1.0)
+            x = a[:, 0] + (y - a[:, 1]) * (b[:, 0] - a[:, 0]) / height_edge
+            x_min = np.where(active, np.minimum(x_min, x), x_min)
+            x_max = np.where(active, np.maximum(x_max, x), x_max)
+
+        # Columns whose texel center is inside [x min, x max)
+        valid = np.isfinite(x_min) & np.isfinite(x_max)
+        first = np.clip(np.ceil(x_min[valid] - 0.5), 0, width).astype(np.int64)
+        end = np.clip(np.ceil(x_max[valid] - 0.5), 0, width).astype(np.int64)
+        keep = end > first
+
+        spans[0].append(triangle[valid][keep])
+        spans[1].append(row[valid][keep])
+        spans[2].append(first[keep])
+        spans[3].append(end[keep])
+
+    if len(spans[0]) == 0:
+        return empty, empty, empty, empty
+    return tuple(np.concatenate(items) for items in spans)
+
+
+
+def get_coverage(spans, width, height):
+    """Number of triangles covering each texel as a (height, width) array, from the spans of get_triangle_spans"""
+    triangle, row, first, end = spans
+
+    # Difference per row: +1 where a span starts, -1 where it ends
+    size = height * (width + 1)
+    difference = np.bincount(row * (width + 1) + first, minlength=size) - np.bincount(row * (width + 1) + end, minlength=size)
+    difference = difference.reshape(height, width + 1)
+    return np.cumsum(difference, axis=1)[:, :width].astype(np.int32)
+
+
+
+def get_spans_sum(spans, values):
+    """Sum of the (height, width) values under each span, using prefix sums per row"""
+    triangle, row, first, end = spans
+    prefix = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.int64)
+    np.cumsum(values, axis=1, out=prefix[:, 1:])
+    return prefix[row, end] - prefix[row, first]
@@ -0,0 +1,71 @@
+import bpy
+import math
+import numpy as np
+
+
+# Affine 2D transforms as 3x3 matrices, applied to loop indices of a UVBuffer.
+# Replaces bpy.ops.transform calls that require selecting each island.
+
+def get_aspect():
+    # Pixel aspect of the image in the UV editor, rotations are done in pixel space like the UV editor does
+    if bpy.context.screen:
+        for area in bpy.context.screen.areas:
+            if area.type == 'IMAGE_EDITOR':
+                image = area.spaces[0].image
+                if image and image.size[0] != 0 and image.size[1] != 0:
+                    return image.size[0] / image.size[1]
+                break
+    return 1.0
+
+
+
+def matrix_translate(offset):
+    matrix = np.identity(3)
+    matrix[0:2, 2] = offset
+    return matrix
+
+
+
+def matrix_scale(scale, pivot=(0, 0)):
+    if np.isscalar(scale):
+        scale = (scale, scale)
+    matrix = np.diag((scale[0], scale[1], 1.0))
+    return matrix_around(matrix, pivot)
+
+
+
+def matrix_rotate(angle, pivot=(0, 0), aspect=1.0):
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    matrix = np.array((
+        (cos, -sin, 0.0),
+        (sin, cos, 0.0),
+        (0.0, 0.0, 1.0)
+    ))
+    if aspect != 1.0:
+        # Rotate in pixel space
+        to_pixels = np.diag((aspect, 1.0, 1.0))
+        matrix = np.linalg.inv(to_pixels) @ matrix @ to_pixels
+    return matrix_around(matrix, pivot)
+
+
+
+def matrix_around(matrix, pivot):
+    return matrix_translate(pivot) @ matrix @ matrix_translate((-pivot[0], -pivot[1]))
+
+
+
+def apply(buffer, loops, matrix):
+    # Transform the UVs of the loops by one matrix
+    uvs = buffer.uvs[loops].astype(np.float64)
+    buffer.uvs[loops] = uvs @ matrix[0:2, 0:2].T + matrix[0:2, 2]
+
+
+
+def apply_batch(buffer, loops, counts, matrices):
+    # Transform many islands at once, loops are sorted by island with counts loops per island
+    if len(loops) == 0:
+        return
+    matrices = np.repeat(np.asarray(matrices), counts, axis=0)
+    uvs = buffer.uvs[loops].astype(np.float64)
+    buffer.uvs[loops] = np.einsum('nij,nj->ni', matrices[:, 0:2, 0:2], uvs) + matrices[:, 0:2, 2]